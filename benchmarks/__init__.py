@@ -0,0 +1,8 @@
+"""
+Benchmarks
+==========
+Timing scripts comparing the python_core engines against the idioms used in
+examples/. Run each one as a module from the repository root:
+
+    python -m benchmarks.bench_primes
+"""
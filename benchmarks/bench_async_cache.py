@@ -0,0 +1,88 @@
+"""
+Async Cache Load Test
+=====================
+Fires many concurrent requests over a small set of keys at a slow coroutine,
+with no cache, with a plain memo dict (no single flight), and with
+async_cached, and counts how often the coroutine body actually ran.
+
+    python -m benchmarks.bench_async_cache [--requests N] [--keys N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from python_core.async_cache import async_cached
+
+
+def make_backend(latency, fail_every=0):
+    calls = {"n": 0}
+
+    async def fetch(key):
+        calls["n"] += 1
+        await asyncio.sleep(latency)
+        if fail_every and key % fail_every == 0:
+            raise LookupError(key)
+        return key * 2
+
+    return fetch, calls
+
+
+def plain_memo(func):
+    """Check-then-compute memo: every caller that misses recomputes"""
+    memo = {}
+
+    async def wrapper(key):
+        if key not in memo:
+            memo[key] = await func(key)
+        return memo[key]
+
+    return wrapper
+
+
+async def load(fetch, keys, requests, waves, seed=0):
+    rng = random.Random(seed)
+    errors = 0
+    for _ in range(waves):
+        batch = [fetch(rng.randrange(keys)) for _ in range(requests)]
+        for result in await asyncio.gather(*batch, return_exceptions=True):
+            errors += isinstance(result, Exception)
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10_000,
+                        help="concurrent requests per wave")
+    parser.add_argument("--waves", type=int, default=3)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print(f"{args.waves} WAVES x {args.requests:,} CONCURRENT REQUESTS, "
+          f"{args.keys} KEYS, {args.latency * 1000:g} ms BACKEND")
+    print("=" * 60)
+    for fail_every in (0, 10):
+        if fail_every:
+            print(f"\n  every {fail_every}th key raises:")
+        variants = [
+            ("no cache", lambda f: f),
+            ("memo dict", plain_memo),
+            ("async_cached", async_cached()),
+            ("+negative_ttl", async_cached(negative_ttl=60)),
+        ]
+        for label, wrap in variants:
+            fetch, calls = make_backend(args.latency, fail_every)
+            cached = wrap(fetch)
+            start = time.perf_counter()
+            errors = asyncio.run(load(cached, args.keys, args.requests,
+                                      args.waves))
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<14} backend calls {calls['n']:>8,}  "
+                  f"errors {errors:>6,}  {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Buffer Pool Benchmark
+=====================
+Binary ingestion with `f.read()` from python_core.file_handling against
+readinto() into python_core.bufferpool buffers, with tracemalloc figures.
+
+    python -m benchmarks.bench_bufferpool [--size-mb N] [--block-kb N]
+
+Each method computes a CRC-32 over the file, which is in the page cache.
+Throughput comes from a run without tracing. A second, traced run reports
+the peak of traced memory and the bytes allocated while reading one block
+(tracemalloc's peak, reset before each read).
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+import zlib
+
+from python_core.bufferpool import BufferPool
+
+
+def read_all(path, block_size, on_block=None):
+    """The example: one f.read() of the whole file"""
+    with open(path, "rb") as f:
+        content = f.read()
+        if on_block:
+            on_block()
+        return zlib.crc32(content)
+
+
+def read_blocks(path, block_size, on_block=None):
+    crc = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                return crc
+            crc = zlib.crc32(block, crc)
+            if on_block:
+                on_block()
+
+
+def pool_stream(path, block_size, on_block=None):
+    pool = BufferPool(2, block_size)
+    crc = 0
+    with open(path, "rb", buffering=0) as f:
+        for view in pool.stream(f):
+            crc = zlib.crc32(view, crc)
+            if on_block:
+                on_block()
+    return crc
+
+
+METHODS = [
+    ("f.read() whole file", read_all),
+    ("f.read(block) loop", read_blocks),
+    ("BufferPool.stream", pool_stream),
+]
+
+
+def traced(func, path, block_size):
+    """(peak traced bytes, median bytes allocated per block)"""
+    per_block = []
+    peaks = []
+    baseline = 0
+
+    def on_block():
+        nonlocal baseline
+        current, peak = tracemalloc.get_traced_memory()
+        per_block.append(peak - baseline)
+        peaks.append(peak)
+        tracemalloc.reset_peak()
+        baseline = current
+
+    tracemalloc.start()
+    func(path, block_size, on_block)
+    peaks.append(tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    # Skip the first block: it includes the pool and the file objects.
+    steady = per_block[1:] or per_block
+    return max(peaks), statistics.median(steady)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--block-kb", type=int, default=1024)
+    args = parser.parse_args(argv)
+    block_size = args.block_kb << 10
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.bin")
+        with open(path, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(1 << 20))
+        size = os.path.getsize(path)
+
+        print("=" * 60)
+        print(f"CRC-32 OF {args.size_mb} MB IN {args.block_kb} KB BLOCKS")
+        print("=" * 60)
+        print(f"  {'method':<22} {'seconds':>7} {'GB/s':>6} {'peak MB':>8} "
+              f"{'bytes/block':>12}")
+        expected = None
+        for label, func in METHODS:
+            start = time.perf_counter()
+            crc = func(path, block_size)
+            elapsed = time.perf_counter() - start
+            if expected is None:
+                expected = crc
+            assert crc == expected, label
+            peak, per_block = traced(func, path, block_size)
+            print(f"  {label:<22} {elapsed:>7.3f} {size / elapsed / 1e9:>6.2f} "
+                  f"{peak / 2**20:>8.2f} {per_block:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Cache Benchmark
+===============
+Replays a Zipf-distributed key stream interleaved with one-off scans against
+each eviction policy at the same byte budget and reports hit rates. Also
+times a cached call against functools.lru_cache.
+
+    python -m benchmarks.bench_cache [--requests N] [--keys N] [--budget BYTES]
+"""
+
+import argparse
+import random
+import time
+from functools import lru_cache
+
+from python_core.cache import POLICIES, Cache, cached
+
+
+def workload(requests, keys, seed=0):
+    """Zipf(1.0) hot set, with a burst of never-repeated keys every 10k"""
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, keys + 1)]
+    hot = rng.choices(range(keys), weights, k=requests)
+    stream = []
+    scan = keys
+    for i, key in enumerate(hot):
+        stream.append(key)
+        if i % 10_000 == 9_999:
+            stream.extend(range(scan, scan + 2_000))
+            scan += 2_000
+    return stream
+
+
+def hit_rate(policy, stream, budget):
+    cache = Cache(max_bytes=budget, policy=policy, sizeof=lambda value: 100)
+    for key in stream:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    info = cache.info()
+    return info.hits / (info.hits + info.misses), info.evictions
+
+
+def per_call(func, args, repeat=200_000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(args)
+    return (time.perf_counter() - start) / repeat * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=50_000)
+    parser.add_argument("--budget", type=int, default=100 * 1_000,
+                        help="bytes; every entry counts as 100")
+    args = parser.parse_args(argv)
+
+    stream = workload(args.requests, args.keys)
+    print("=" * 60)
+    print(f"HIT RATE: {len(stream):,} REQUESTS, {args.budget:,} BYTE BUDGET")
+    print("=" * 60)
+    for policy in POLICIES:
+        start = time.perf_counter()
+        rate, evictions = hit_rate(policy, stream, args.budget)
+        elapsed = time.perf_counter() - start
+        print(f"  {policy:<8} hit rate {rate:6.1%}  evictions {evictions:>9,}"
+              f"  {elapsed:6.2f} s")
+
+    print("\n" + "=" * 60)
+    print("PER-CALL OVERHEAD ON A HIT")
+    print("=" * 60)
+    identity = lambda n: n
+    baseline = lru_cache(maxsize=128)(identity)
+    print(f"  lru_cache            {per_call(baseline, 7):8.0f} ns")
+    for policy in POLICIES:
+        func = cached(max_entries=128, policy=policy)(identity)
+        print(f"  cached({policy!r:<9})   {per_call(func, 7):8.0f} ns")
+    func = cached(max_entries=128)(identity)
+    print(f"  cached, list arg     {per_call(func, [1, 2, 3]):8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Chunked Iteration Benchmark
+===========================
+Per-item throughput of the generators in python_core.functions and the
+CountUpTo iterator in python_core.advanced_topics against the chunked
+versions in python_core.chunked.
+
+    python -m benchmarks.bench_chunked [--size N]
+"""
+
+import argparse
+import time
+
+from python_core import chunked
+
+
+def countdown(n):
+    """Generator that counts down from n"""
+    while n > 0:
+        yield n
+        n -= 1
+
+
+def squares(n):
+    """Generator for squares up to n"""
+    for i in range(1, n + 1):
+        yield i ** 2
+
+
+class CountUpTo:
+    """Custom iterator that counts up to n"""
+
+    def __init__(self, n):
+        self.n = n
+        self.current = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.current < self.n:
+            self.current += 1
+            return self.current
+        raise StopIteration
+
+
+def throughput(func, n):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    return result, n / elapsed / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=5_000_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="*",
+                        default=[64, 1024, 4096, 65536])
+    args = parser.parse_args(argv)
+    n = args.size
+
+    cases = [
+        ("countdown", lambda: sum(countdown(n)),
+         lambda size, typecode=None: chunked.countdown(n, size, typecode)),
+        ("squares", lambda: sum(squares(n)),
+         lambda size, typecode=None: chunked.squares(n, size, typecode)),
+        ("CountUpTo", lambda: sum(CountUpTo(n)),
+         lambda size, typecode=None: chunked.Chunked(
+             lambda: chunked.CountUpTo(n).chunks(size, typecode))),
+    ]
+
+    for name, per_item, make in cases:
+        print("=" * 60)
+        print(f"SUM OF {name.upper()} ({n:,} values, million values/s)")
+        print("=" * 60)
+        expected, rate = throughput(per_item, n)
+        print(f"  per-item generator:       {rate:8.1f}")
+        for size in args.chunk_sizes:
+            got, flat = throughput(lambda: sum(make(size)), n)
+            assert got == expected
+            got, blocks = throughput(lambda: make(size).sum(), n)
+            assert got == expected
+            got, arrays = throughput(lambda: make(size, "q").sum(), n)
+            assert got == expected
+            print(f"  chunk {size:>6}: flattened {flat:6.1f}  per-block {blocks:6.1f}"
+                  f"  array('q') blocks {arrays:6.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Disk Cache Benchmark
+====================
+Starts fresh interpreters that compute the same batch of results with no
+cache, then against an empty disk cache (cold start), then against the file
+the cold run left behind (warm start). The last run uses a changed function,
+which must recompute.
+
+    python -m benchmarks.bench_disk_cache [--tasks N] [--size N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+TASK_MODULE = """
+from python_core.primes import count_primes
+
+def prime_density(lo, width):
+    return count_primes(lo, lo + width) {scale}/ width
+"""
+
+WORKER = """
+import sys
+from python_core.disk_cache import disk_cached
+from bench_task import prime_density
+
+mode, path, tasks, size = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+if mode != "none":
+    prime_density = disk_cached(path)(prime_density)
+total = sum(prime_density(i * size, size) for i in range(tasks))
+if mode != "none":
+    info = prime_density.cache_info()
+    print(f"hits={info.hits} misses={info.misses} bytes={info.bytes}")
+"""
+
+
+def write_task(directory, scale=""):
+    with open(os.path.join(directory, "bench_task.py"), "w") as f:
+        f.write(TASK_MODULE.format(scale=scale))
+
+
+def run(mode, directory, path, tasks, size):
+    env = dict(os.environ, PYTHONHASHSEED="random",
+               PYTHONPATH=os.pathsep.join([directory, os.getcwd()]),
+               PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, mode, path, str(tasks), str(size)],
+        capture_output=True, text=True, check=True, env=env)
+    return time.perf_counter() - start, result.stdout.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print(f"{args.tasks} TASKS, count_primes OVER {args.size:,} NUMBERS EACH")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "memo.sqlite3")
+        write_task(tmp)
+        baseline = None
+        for label, mode in [("no cache", "none"), ("cold start", "cached"),
+                            ("warm start", "cached"),
+                            ("code changed", "changed")]:
+            if mode == "changed":
+                write_task(tmp, scale="* 1.0 ")
+            elapsed, info = run(mode, tmp, path, args.tasks, args.size)
+            baseline = baseline or elapsed
+            print(f"  {label:<14} {elapsed:8.3f} s  {baseline / elapsed:6.1f}x"
+                  f"  {info}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Fibonacci Benchmark
+===================
+Compares the doubly recursive `fibonacci` from python_core.functions and
+the `lru_cache` version from python_core.advanced_topics with the fast
+doubling implementation in python_core.fibonacci.
+
+    python -m benchmarks.bench_fibonacci
+"""
+
+import argparse
+import sys
+import time
+from functools import lru_cache
+
+from python_core.fibonacci import fibonacci, fibonacci_many
+
+
+def recursive_fibonacci(n):
+    """Reference copy of fibonacci from python_core.functions"""
+    if n <= 1:
+        return n
+    return recursive_fibonacci(n - 1) + recursive_fibonacci(n - 2)
+
+
+@lru_cache(maxsize=128)
+def fibonacci_cached(n):
+    """Reference copy of fibonacci_cached from python_core.advanced_topics"""
+    if n < 2:
+        return n
+    return fibonacci_cached(n-1) + fibonacci_cached(n-2)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_small(n):
+    print("=" * 60)
+    print(f"SMALL n = {n}")
+    print("=" * 60)
+    expected, t_rec = timed(recursive_fibonacci, n)
+    fibonacci_cached.cache_clear()
+    cached, t_cached = timed(fibonacci_cached, n)
+    fast, t_fast = timed(fibonacci, n)
+    assert expected == cached == fast
+    print(f"  recursive:      {t_rec * 1e6:12.1f} us")
+    print(f"  lru_cache:      {t_cached * 1e6:12.1f} us")
+    print(f"  fast doubling:  {t_fast * 1e6:12.1f} us")
+
+
+def bench_cached_limit(n):
+    print("\n" + "=" * 60)
+    print(f"RECURSION LIMIT (sys.getrecursionlimit() = {sys.getrecursionlimit()})")
+    print("=" * 60)
+    fibonacci_cached.cache_clear()
+    try:
+        fibonacci_cached(n)
+        print(f"  lru_cache F({n}): ok")
+    except RecursionError:
+        print(f"  lru_cache F({n}): RecursionError")
+    value, elapsed = timed(fibonacci, n)
+    print(f"  fast doubling F({n}): {value.bit_length()} bits "
+          f"in {elapsed * 1e6:.1f} us")
+
+
+def bench_large(sizes):
+    print("\n" + "=" * 60)
+    print("LARGE n (fast doubling only)")
+    print("=" * 60)
+    for n in sizes:
+        value, elapsed = timed(fibonacci, n)
+        print(f"  F({n:>10,}): {value.bit_length():>10,} bits in {elapsed:8.3f} s")
+
+
+def bench_batched(base, count, step):
+    print("\n" + "=" * 60)
+    print(f"BATCHED: {count} queries from {base:,} in steps of {step:,}")
+    print("=" * 60)
+    ns = [base + i * step for i in range(count)]
+    one_by_one, t_single = timed(lambda: [fibonacci(n) for n in ns])
+    batched, t_batched = timed(fibonacci_many, ns)
+    assert one_by_one == batched
+    print(f"  independent calls: {t_single:8.3f} s")
+    print(f"  fibonacci_many:    {t_batched:8.3f} s  "
+          f"({t_single / t_batched:.1f}x faster)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--small", type=int, default=27)
+    parser.add_argument("--large", type=int, nargs="*",
+                        default=[10**4, 10**5, 10**6, 10**7])
+    args = parser.parse_args(argv)
+
+    bench_small(args.small)
+    bench_cached_limit(5000)
+    bench_large(args.large)
+    bench_batched(10**6, 20, 1000)
+
+
+if __name__ == "__main__":
+    main()
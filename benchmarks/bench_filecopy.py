@@ -0,0 +1,124 @@
+"""
+File Copy Benchmark
+===================
+Copy throughput and peak Python memory of `dst.write(src.read())` from
+python_core.file_handling against python_core.filecopy.
+
+    python -m benchmarks.bench_filecopy [--size-mb N] [--files N]
+
+Sources are in the page cache and destinations are written into it, so
+the numbers measure copying work, not the disk. Each destination is
+deleted before the next run. GB/s is the apparent file size over the
+time taken, so a sparse copy that skips its holes scores very high.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from python_core.filecopy import copy_file, copy_many
+
+LINE = b"2024-01-01 10:00:00 - worker-7 - request 123456 took 42 ms\n"
+
+
+def example_copy(src, dst):
+    """Example 3: the whole file as one str"""
+    with open(src, 'r') as fsrc, open(dst, 'w') as fdst:
+        fdst.write(fsrc.read())
+
+
+def binary_copy(src, dst):
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fdst.write(fsrc.read())
+
+
+def run(label, func, src, dst, trace=True):
+    start = time.perf_counter()
+    func(src, dst)
+    elapsed = time.perf_counter() - start
+    allocated = os.stat(dst).st_blocks * 512
+    os.remove(dst)
+    peak = ""
+    if trace:
+        tracemalloc.start()
+        func(src, dst)
+        peak = f"{tracemalloc.get_traced_memory()[1] / 2**20:8.2f}"
+        tracemalloc.stop()
+        os.remove(dst)
+    size = os.path.getsize(src)
+    print(f"  {label:<30} {elapsed:>7.3f} {size / elapsed / 1e9:>6.2f} "
+          f"{peak:>8} {allocated / 2**20:>10.1f}")
+
+
+def header():
+    print(f"  {'method':<30} {'seconds':>7} {'GB/s':>6} {'peak MB':>8} "
+          f"{'on disk MB':>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--files", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "big.log")
+        dst = os.path.join(tmp, "copy.log")
+        with open(src, "wb") as f:
+            f.write(LINE * ((args.size_mb << 20) // len(LINE)))
+
+        print("=" * 60)
+        print(f"ONE {args.size_mb} MB FILE")
+        print("=" * 60)
+        header()
+        for label, func in [
+            ("dst.write(src.read()) text", example_copy),
+            ("dst.write(src.read()) binary", binary_copy),
+            ("shutil.copyfile", shutil.copyfile),
+        ] + [(f"copy_file {method}",
+              lambda s, d, m=method: copy_file(s, d, methods=(m,)))
+             for method in ("copy_file_range", "sendfile", "readinto")]:
+            run(label, func, src, dst)
+
+        sparse = os.path.join(tmp, "disk.img")
+        with open(sparse, "wb") as f:
+            for offset in range(0, 1 << 30, 128 << 20):
+                f.seek(offset)
+                f.write(LINE * 16384)  # about 1 MB of data every 128 MB
+            f.truncate(1 << 30)
+        print("\n" + "=" * 60)
+        print(f"SPARSE 1 GB FILE, "
+              f"{os.stat(sparse).st_blocks * 512 / 2**20:.0f} MB ALLOCATED")
+        print("=" * 60)
+        header()
+        run("shutil.copyfile", shutil.copyfile, sparse, dst, trace=False)
+        run("copy_file sparse=False",
+            lambda s, d: copy_file(s, d, sparse=False), sparse, dst,
+            trace=False)
+        run("copy_file", copy_file, sparse, dst)
+        os.remove(sparse)
+
+        sources = []
+        for i in range(args.files):
+            path = os.path.join(tmp, f"part{i}.log")
+            with open(path, "wb") as f:
+                f.write(LINE * ((16 << 20) // len(LINE)))
+            sources.append(path)
+        os.remove(src)
+        print("\n" + "=" * 60)
+        print(f"{args.files} FILES OF 16 MB")
+        print("=" * 60)
+        for workers in (1, 4, 8):
+            pairs = [(path, path + ".copy") for path in sources]
+            report = copy_many(pairs, max_workers=workers)
+            print(f"  copy_many, {workers} threads  {report.seconds:7.3f} s "
+                  f"{report.bytes_per_second / 1e9:6.2f} GB/s")
+            for _, target in pairs:
+                os.remove(target)
+
+
+if __name__ == "__main__":
+    main()
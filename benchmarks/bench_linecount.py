@@ -0,0 +1,87 @@
+"""
+Line Count Benchmark
+====================
+Line counting with `process_file` from python_core.exception_handling
+(len(f.readlines())) against python_core.linecount, over a set of files.
+
+    python -m benchmarks.bench_linecount [--files N] [--size-mb N]
+
+Files are in the page cache when timed, so the numbers compare CPU cost,
+and the thread pool can only overlap what the GIL releases. Peak memory is
+the tracemalloc peak while counting one file.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from python_core.exception_handling import process_file
+from python_core.linecount import count_lines, count_lines_many
+
+LINE = b"2024-01-01 10:00:00 - worker-7 - request 123456 took 42 ms\n"
+
+
+def generator_count(path):
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+def peak_mb(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--size-mb", type=int, default=16,
+                        help="size of each file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(tmp, f"app{i}.log")
+            with open(path, "wb") as f:
+                f.write(LINE * ((args.size_mb << 20) // len(LINE) + i))
+            paths.append(path)
+        total = sum(map(os.path.getsize, paths))
+
+        print("=" * 60)
+        print(f"{len(paths)} FILES, {total / 2**20:,.0f} MB")
+        print("=" * 60)
+        print(f"  {'method':<30} {'seconds':>8} {'GB/s':>7} {'peak MB':>8}")
+        expected = None
+        runs = [
+            ("len(f.readlines())", lambda: [process_file(p) for p in paths],
+             process_file),
+            ("sum(1 for _ in f)", lambda: [generator_count(p) for p in paths],
+             generator_count),
+            ("count_lines", lambda: [count_lines(p) for p in paths],
+             count_lines),
+        ]
+        for workers in (1, 4, 16):
+            runs.append((f"count_lines_many, {workers} threads",
+                         lambda w=workers: list(
+                             count_lines_many(paths, w).values()),
+                         None))
+        for label, run, single in runs:
+            start = time.perf_counter()
+            counts = run()
+            elapsed = time.perf_counter() - start
+            if expected is None:
+                expected = counts
+            assert counts == expected, label
+            peak = f"{peak_mb(single, paths[0]):8.2f}" if single else ""
+            print(f"  {label:<30} {elapsed:>8.3f} "
+                  f"{total / elapsed / 1e9:>7.2f} {peak:>8}")
+        print(f"\n  {sum(expected):,} lines")
+
+
+if __name__ == "__main__":
+    main()
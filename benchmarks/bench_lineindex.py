@@ -0,0 +1,113 @@
+"""
+Line Index Benchmark
+====================
+Time to reach a random line N with the enumerate loop from
+python_core.file_handling against python_core.lineindex, plus the cost of
+building, loading and incrementally extending the index.
+
+    python -m benchmarks.bench_lineindex [--size-mb N] [--lookups N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from itertools import islice
+
+from python_core.lineindex import LineIndex
+
+
+def write_log(path, size, mode="wb", seed=0):
+    rng = random.Random(seed)
+    with open(path, mode) as f:
+        written = 0
+        while written < size:
+            chunk = "".join(
+                f"2024-01-01T10:{rng.randrange(60):02d} worker-{rng.randrange(16)}"
+                f" request {rng.randrange(10**9)} took {rng.randrange(5000)} ms\n"
+                for _ in range(10_000)).encode()
+            f.write(chunk)
+            written += len(chunk)
+
+
+def enumerate_to(path, n):
+    """The example's pattern: read from the start until line n"""
+    with open(path) as f:
+        for line_num, line in enumerate(f):
+            if line_num == n:
+                return line.rstrip("\n")
+
+
+def islice_to(path, n):
+    with open(path) as f:
+        return next(islice(f, n, None)).rstrip("\n")
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args(argv)
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        write_log(path, args.size_mb << 20)
+        size = os.path.getsize(path)
+
+        print("=" * 60)
+        print(f"INDEX {size / 2**20:,.0f} MB")
+        print("=" * 60)
+        elapsed, index = timed(LineIndex, path)
+        lines = len(index)
+        index.close()
+        print(f"  build      {elapsed:8.3f} s  {size / elapsed / 1e9:.2f} GB/s, "
+              f"{lines:,} lines")
+        print(f"  sidecar    {os.path.getsize(index.index_path) / 2**20:8.1f} MB")
+        elapsed, index = timed(LineIndex, path)
+        print(f"  load       {elapsed * 1e3:8.2f} ms")
+
+        write_log(path, 1 << 20, "ab", seed=2)
+        elapsed, added = timed(index.refresh)
+        print(f"  append 1 MB, refresh {elapsed * 1e3:.2f} ms, "
+              f"+{added:,} lines")
+        lines = len(index)
+
+        print("\n" + "=" * 60)
+        print("RANDOM LINE LOOKUP")
+        print("=" * 60)
+        targets = [rng.randrange(lines) for _ in range(5)]
+        for label, func in (("enumerate(f)", enumerate_to),
+                            ("islice(f, n)", islice_to)):
+            times = []
+            for n in targets:
+                elapsed, line = timed(func, path, n)
+                assert line.encode() == index.get_line(n)
+                times.append(elapsed)
+            print(f"  {label:<18} {statistics.median(times) * 1e3:10.1f} ms "
+                  f"per lookup (median of {len(targets)})")
+
+        targets = [rng.randrange(lines) for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for n in targets:
+            index.get_line(n)
+        per_line = (time.perf_counter() - start) / len(targets)
+        print(f"  {'get_line(n)':<18} {per_line * 1e6:10.1f} us per lookup")
+        start = time.perf_counter()
+        for n in targets[:1000]:
+            index.get_lines(n, n + 100)
+        per_range = (time.perf_counter() - start) / 1000
+        print(f"  {'get_lines(n, n+100)':<18} {per_range * 1e6:9.1f} us per range")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
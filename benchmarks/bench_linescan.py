@@ -0,0 +1,120 @@
+"""
+Line Scanning Benchmark
+=======================
+Throughput in GB/s of the line-reading idioms in python_core.file_handling
+against python_core.linescan, on a generated log file.
+
+    python -m benchmarks.bench_linescan [--size-mb N]
+
+The file is read once before timing so every idiom reads from the page cache
+and the numbers measure CPU cost, not the disk. Peak Python memory comes
+from a second, untimed pass under tracemalloc. mmap pages are not Python
+allocations, so they do not show up there.
+"""
+
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+
+from python_core.linescan import LineScanner
+
+LEVELS = [b"INFO"] * 17 + [b"WARN"] * 2 + [b"ERROR"]
+ERROR_AFTER_NEWLINE = re.compile(rb"\nERROR")
+
+
+def write_log(path, size):
+    rng = random.Random(0)
+    with open(path, "wb") as f:
+        written = 0
+        while written < size:
+            chunk = b"".join(
+                b"%s 2024-01-01T10:%02d:%02d worker-%d request %d took %d ms\n"
+                % (rng.choice(LEVELS), rng.randrange(60), rng.randrange(60),
+                   rng.randrange(16), rng.randrange(10**9), rng.randrange(5000))
+                for _ in range(10_000))
+            f.write(chunk)
+            written += len(chunk)
+
+
+# Each idiom counts the lines that start with ERROR.
+
+def text_readlines(path):
+    with open(path) as f:
+        lines = f.readlines()
+    return sum(1 for line in lines if line.startswith("ERROR"))
+
+
+def text_iteration(path):
+    with open(path) as f:
+        return sum(1 for line in f if line.startswith("ERROR"))
+
+
+def binary_iteration(path):
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.startswith(b"ERROR"))
+
+
+def mmap_lines(path):
+    with LineScanner(path) as scanner:
+        return sum(1 for line in scanner.lines() if line[:5] == b"ERROR")
+
+
+def mmap_blocks(path):
+    # Blocks start at a line start, so a line is an ERROR line if it opens
+    # the block or follows a newline inside it. A literal pattern lets re
+    # skip ahead with a fast substring search instead of testing every ^.
+    with LineScanner(path) as scanner:
+        return sum(len(ERROR_AFTER_NEWLINE.findall(block))
+                   + (block[:5] == b"ERROR")
+                   for block in scanner.blocks())
+
+
+IDIOMS = [
+    ("readlines() + str", text_readlines),
+    ("for line in f (text)", text_iteration),
+    ("for line in f (binary)", binary_iteration),
+    ("LineScanner.lines()", mmap_lines),
+    ("LineScanner.blocks() + re", mmap_blocks),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        write_log(path, args.size_mb << 20)
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            while f.read(1 << 24):
+                pass
+
+        print("=" * 60)
+        print(f"COUNT ERROR LINES IN {size / 2**20:,.0f} MB")
+        print("=" * 60)
+        print(f"  {'idiom':<28} {'seconds':>8} {'GB/s':>7} {'peak MB':>9}")
+        expected = None
+        for label, idiom in IDIOMS:
+            start = time.perf_counter()
+            found = idiom(path)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            idiom(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if expected is None:
+                expected = found
+            assert found == expected, (label, found, expected)
+            print(f"  {label:<28} {elapsed:>8.2f} {size / elapsed / 1e9:>7.2f} "
+                  f"{peak / 2**20:>9.1f}")
+        print(f"\n  {expected:,} ERROR lines")
+
+
+if __name__ == "__main__":
+    main()
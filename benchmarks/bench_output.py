@@ -0,0 +1,95 @@
+"""
+Output Sink Benchmark
+=====================
+Runs every script in examples/ under each PYTHON_CORE_OUTPUT mode, with
+stdout attached to a pseudo-terminal (line-buffered, as in an interactive
+shell) or to a pipe (as under a harness), and reports wall time per script.
+
+    python -m benchmarks.bench_output [--repeat N] [--target tty|pipe|both]
+"""
+
+import argparse
+import glob
+import os
+import pty
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("direct", "buffered", "null")
+
+
+def _drain(fd):
+    try:
+        while os.read(fd, 65536):
+            pass
+    except OSError:
+        pass
+
+
+def run_script(path, mode, target):
+    """(wall time, exit code) of one run with stdout on a tty or a pipe"""
+    env = dict(os.environ, PYTHON_CORE_OUTPUT=mode)
+    with tempfile.TemporaryDirectory() as cwd:
+        if target == "tty":
+            master, slave = pty.openpty()
+            reader = threading.Thread(target=_drain, args=(master,),
+                                      daemon=True)
+            reader.start()
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, path], cwd=cwd, env=env,
+                                  stdout=slave, stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            os.close(slave)
+            reader.join(1)
+            os.close(master)
+        else:
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, path], cwd=cwd, env=env,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+    return elapsed, proc.returncode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="best of N runs per script and mode")
+    parser.add_argument("--target", choices=("tty", "pipe", "both"),
+                        default="both")
+    args = parser.parse_args(argv)
+    scripts = sorted(glob.glob(os.path.join(ROOT, "examples", "[0-9]*.py")))
+    targets = ("tty", "pipe") if args.target == "both" else (args.target,)
+
+    for target in targets:
+        print("=" * 60)
+        print(f"STDOUT ON A {target.upper()} (best of {args.repeat}, ms)")
+        print("=" * 60)
+        print(f"  {'script':<32}" + "".join(f"{m:>10}" for m in MODES))
+        totals = dict.fromkeys(MODES, 0.0)
+        failed = set()
+        for path in scripts:
+            row = []
+            for mode in MODES:
+                runs = [run_script(path, mode, target)
+                        for _ in range(args.repeat)]
+                if any(code for _, code in runs):
+                    failed.add(os.path.basename(path))
+                best = min(elapsed for elapsed, _ in runs)
+                totals[mode] += best
+                row.append(best)
+            name = os.path.basename(path)
+            name += " (failed)" if name in failed else ""
+            print(f"  {name:<32}"
+                  + "".join(f"{t * 1000:>10.1f}" for t in row))
+        print(f"  {'TOTAL':<32}"
+              + "".join(f"{totals[m] * 1000:>10.1f}" for m in MODES))
+        print()
+
+
+if __name__ == "__main__":
+    main()
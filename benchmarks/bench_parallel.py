@@ -0,0 +1,70 @@
+"""
+Parallel Map/Filter/Reduce Benchmark
+====================================
+Scaling of python_core.parallel from 1 to N workers on CPU-bound lambdas,
+against the single-core built-ins used in python_core.functions.
+
+    python -m benchmarks.bench_parallel [--items N] [--max-workers N]
+"""
+
+import argparse
+import os
+import time
+from functools import reduce
+
+from python_core.parallel import pfilter, pmap, preduce
+
+
+def cpu_bound(x):
+    return sum(i * i for i in range(200 + x % 100))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    numbers = list(range(args.items))
+
+    heavy = lambda x: cpu_bound(x) * 2
+    keep = lambda x: cpu_bound(x) % 3 == 0
+
+    print("=" * 60)
+    print(f"BUILT-INS ({args.items:,} items, 1 core)")
+    print("=" * 60)
+    mapped, t_map = timed(lambda: list(map(heavy, numbers)))
+    kept, t_filter = timed(lambda: list(filter(keep, numbers)))
+    total, t_reduce = timed(lambda: reduce(lambda x, y: x + y, map(cpu_bound, numbers)))
+    print(f"  map:    {t_map:7.3f} s")
+    print(f"  filter: {t_filter:7.3f} s")
+    print(f"  reduce: {t_reduce:7.3f} s")
+
+    worker_counts = sorted({1, 2, 4, 8, args.max_workers})
+    worker_counts = [n for n in worker_counts if n <= args.max_workers]
+
+    for executor in ("process", "thread"):
+        print("\n" + "=" * 60)
+        print(f"{executor.upper()} POOL (speedup vs built-in)")
+        print("=" * 60)
+        for workers in worker_counts:
+            options = dict(executor=executor, workers=workers)
+            got, t_pmap = timed(lambda: list(pmap(heavy, numbers, **options)))
+            assert got == mapped
+            got, t_pfilter = timed(lambda: list(pfilter(keep, numbers, **options)))
+            assert got == kept
+            got, t_preduce = timed(lambda: preduce(
+                lambda x, y: x + y, pmap(cpu_bound, numbers, **options), **options))
+            assert got == total
+            print(f"  {workers:2d} workers:  pmap {t_map / t_pmap:5.2f}x  "
+                  f"pfilter {t_filter / t_pfilter:5.2f}x  "
+                  f"preduce {t_reduce / t_preduce:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Staged Pipeline Benchmark
+=========================
+The serial `numbers -> square -> filter_even` generator pipeline from
+python_core.advanced_topics, with a CPU-heavy stage added, against
+python_core.pipeline running the stages concurrently.
+
+    python -m benchmarks.bench_pipeline [--size N]
+"""
+
+import argparse
+import time
+
+from python_core.pipeline import Pipeline, Stage
+
+
+def square(gen):
+    """Square generator"""
+    for num in gen:
+        yield num ** 2
+
+
+def digest(gen):
+    """CPU-heavy stage: a small amount of arithmetic per item"""
+    for num in gen:
+        yield sum(i * num for i in range(50))
+
+
+def filter_even(gen):
+    """Filter even numbers"""
+    for num in gen:
+        if num % 2 == 0:
+            yield num
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    n = args.size
+
+    print("=" * 60)
+    print(f"numbers -> square -> digest -> filter_even ({n:,} items)")
+    print("=" * 60)
+    expected, t_serial = timed(
+        lambda: list(filter_even(digest(square(iter(range(n)))))))
+    print(f"  serial generators:   {t_serial:7.3f} s")
+
+    layouts = [
+        ("all threads", [square, digest, filter_even]),
+        ("digest in a process", [square, Stage(digest, mode="process"),
+                                 filter_even]),
+    ]
+    for label, stages in layouts:
+        pipe = Pipeline(range(n), *stages)
+        got, elapsed = timed(pipe.run)
+        assert got == expected
+        print(f"\n  {label}: {elapsed:7.3f} s ({t_serial / elapsed:.2f}x)")
+        print("  " + pipe.report().replace("\n", "\n  "))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Prime Engine Benchmark
+======================
+Compares the trial-division `is_prime` from python_core.control_flow with
+the segmented sieve and Miller-Rabin test in python_core.primes.
+
+    python -m benchmarks.bench_primes [--limit N] [--workers N]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from python_core.primes import count_primes, is_prime, primes_between
+
+
+def trial_division_is_prime(n):
+    """Reference copy of is_prime from python_core.control_flow"""
+    if n < 2:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def bench_listing(limit, workers):
+    print("=" * 60)
+    print(f"LISTING PRIMES BELOW {limit:,}")
+    print("=" * 60)
+
+    baseline, t_trial = timed(
+        lambda: [n for n in range(limit) if trial_division_is_prime(n)])
+    print(f"  trial division:        {t_trial:8.3f} s  ({len(baseline):,} primes)")
+
+    sieved, t_sieve = timed(lambda: list(primes_between(0, limit)))
+    assert sieved == baseline
+    print(f"  segmented sieve:       {t_sieve:8.3f} s  "
+          f"({t_trial / t_sieve:,.0f}x faster)")
+
+    counted, t_count = timed(count_primes, 0, limit, workers=workers)
+    assert counted == len(baseline)
+    print(f"  count_primes x{workers:<2}:      {t_count:8.3f} s  "
+          f"({t_trial / t_count:,.0f}x faster)")
+
+
+def bench_scaling(limit, workers):
+    print("\n" + "=" * 60)
+    print(f"COUNTING PRIMES BELOW {limit:,} (SIEVE ONLY)")
+    print("=" * 60)
+    serial = None
+    for n in sorted({1, workers}):
+        count, elapsed = timed(count_primes, 0, limit, workers=n)
+        serial = serial or elapsed
+        print(f"  {n:2d} worker(s): {elapsed:8.3f} s  {count:,} primes  "
+              f"speedup {serial / elapsed:.2f}x")
+
+
+def bench_single_queries(count):
+    print("\n" + "=" * 60)
+    print(f"SINGLE QUERIES ({count:,} random values)")
+    print("=" * 60)
+    rng = random.Random(42)
+
+    small = [rng.randrange(10**9, 10**10) for _ in range(count)]
+    expected, t_trial = timed(lambda: [trial_division_is_prime(n) for n in small])
+    got, t_mr = timed(lambda: [is_prime(n) for n in small])
+    assert got == expected
+    print(f"  10-digit, trial division: {t_trial:8.3f} s")
+    print(f"  10-digit, Miller-Rabin:   {t_mr:8.3f} s  "
+          f"({t_trial / t_mr:,.0f}x faster)")
+
+    large = [rng.randrange(2**62, 2**64) | 1 for _ in range(count)]
+    _, t_large = timed(lambda: [is_prime(n) for n in large])
+    print(f"  64-bit, Miller-Rabin:     {t_large:8.3f} s  "
+          f"({count / t_large:,.0f} queries/s; trial division is infeasible)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=10**6,
+                        help="upper bound for the trial-division comparison")
+    parser.add_argument("--sieve-limit", type=int, default=10**8,
+                        help="upper bound for the sieve-only scaling run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    bench_listing(args.limit, args.workers)
+    bench_scaling(args.sieve_limit, args.workers)
+    bench_single_queries(args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Product Tree Benchmark
+======================
+Compares one-term-at-a-time multiplication, as in the factorial loop of
+python_core.control_flow and the `reduce` product in
+python_core.functions, with python_core.products and math.factorial.
+
+    python -m benchmarks.bench_products [--sizes N ...]
+"""
+
+import argparse
+import math
+import time
+from functools import reduce
+
+from python_core.products import factorial, product_tree
+
+
+def loop_factorial(n):
+    """The factorial loop from python_core.control_flow"""
+    factorial = 1
+    for i in range(1, n + 1):
+        factorial *= i
+    return factorial
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_factorial(sizes, loop_limit):
+    print("=" * 60)
+    print("FACTORIAL (seconds)")
+    print("=" * 60)
+    print(f"  {'n':>10}  {'loop':>9}  {'splitting':>9}  {'math':>9}")
+    for n in sizes:
+        expected, t_math = timed(math.factorial, n)
+        got, t_split = timed(factorial, n)
+        assert got == expected
+        if n <= loop_limit:
+            looped, t_loop = timed(loop_factorial, n)
+            assert looped == expected
+            loop_col = f"{t_loop:9.3f}"
+        else:
+            loop_col = f"{'skipped':>9}"
+        print(f"  {n:>10,}  {loop_col}  {t_split:9.3f}  {t_math:9.3f}")
+
+
+def bench_product(count):
+    print("\n" + "=" * 60)
+    print(f"PRODUCT OF {count:,} INTEGERS")
+    print("=" * 60)
+    numbers = list(range(1, count + 1))
+    expected, t_reduce = timed(reduce, lambda x, y: x * y, numbers)
+    got, t_tree = timed(product_tree, numbers)
+    assert got == expected
+    print(f"  reduce(lambda x, y: x * y): {t_reduce:8.3f} s")
+    print(f"  product_tree:               {t_tree:8.3f} s  "
+          f"({t_reduce / t_tree:.1f}x faster)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--loop-limit", type=int, default=10**5,
+                        help="largest n to run the quadratic loop for")
+    parser.add_argument("--product-count", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    bench_factorial(args.sizes, args.loop_limit)
+    bench_product(args.product_count)
+
+
+if __name__ == "__main__":
+    main()
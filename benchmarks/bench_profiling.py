@@ -0,0 +1,76 @@
+"""
+Profiling Overhead Benchmark
+============================
+Per-call overhead of the printing `timing_decorator` from
+python_core.functions against python_core.profiling.timing_decorator,
+both enabled and disabled.
+
+    python -m benchmarks.bench_profiling [--calls N]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from functools import wraps
+
+from python_core.profiling import Registry, timing_decorator
+
+
+def printing_timing_decorator(func):
+    """Reference copy of timing_decorator from python_core.functions"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.time()
+        result = func(*args, **kwargs)
+        end = time.time()
+        print(f"{func.__name__} took {end - start:.4f} seconds")
+        return result
+    return wrapper
+
+
+def work(x):
+    return x * 2
+
+
+def per_call_ns(func, calls):
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    bench_registry = Registry()
+    recorded = timing_decorator(work, registry=bench_registry)
+    printing = printing_timing_decorator(work)
+
+    print("=" * 60)
+    print(f"PER-CALL COST OVER {args.calls:,} CALLS (ns)")
+    print("=" * 60)
+    bare = per_call_ns(work, args.calls)
+    print(f"  undecorated:                    {bare:8.0f}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        printed = per_call_ns(printing, args.calls)
+    print(f"  printing decorator (to memory): {printed:8.0f}")
+
+    bench_registry.disable()
+    disabled = per_call_ns(recorded, args.calls)
+    print(f"  registry disabled:              {disabled:8.0f}  "
+          f"(+{disabled - bare:.0f})")
+
+    bench_registry.enable()
+    enabled = per_call_ns(recorded, args.calls)
+    print(f"  registry enabled:               {enabled:8.0f}  "
+          f"(+{enabled - bare:.0f})")
+
+    print("\n" + bench_registry.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Fused Query Benchmark
+=====================
+The nested-generator pipeline from python_core.advanced_topics and the
+map/filter chain from python_core.functions against python_core.query.Q.
+
+    python -m benchmarks.bench_query [--size N]
+"""
+
+import argparse
+import time
+
+from python_core.query import Q
+
+
+def numbers(n):
+    """Generate numbers"""
+    for i in range(n):
+        yield i
+
+
+def square(gen):
+    """Square generator"""
+    for num in gen:
+        yield num ** 2
+
+
+def filter_even(gen):
+    """Filter even numbers"""
+    for num in gen:
+        if num % 2 == 0:
+            yield num
+
+
+def best_of(func, repeat=5):
+    result = func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    n = args.size
+
+    cases = [
+        ("nested generators", lambda: list(filter_even(square(numbers(n))))),
+        ("filter(map(lambda))", lambda: list(
+            filter(lambda x: x % 2 == 0, map(lambda x: x ** 2, range(n))))),
+        ("Q with lambdas", lambda: Q(range(n)).map(lambda x: x ** 2)
+            .filter(lambda x: x % 2 == 0).to_list()),
+        ("Q with expressions", lambda: Q(range(n)).map("x ** 2")
+            .filter("x % 2 == 0").to_list()),
+        ("list comprehension", lambda: [
+            y for y in (x ** 2 for x in range(n)) if y % 2 == 0]),
+    ]
+
+    print("=" * 60)
+    print(f"SQUARE THEN KEEP EVENS OVER {n:,} NUMBERS (best of 5)")
+    print("=" * 60)
+    expected = baseline = None
+    for label, func in cases:
+        result, elapsed = best_of(func)
+        if expected is None:
+            expected, baseline = result, elapsed
+        assert result == expected
+        print(f"  {label:<22} {elapsed:8.4f} s  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
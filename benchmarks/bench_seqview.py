@@ -0,0 +1,109 @@
+"""
+Sequence View Benchmark
+=======================
+Measures the time and memory of `numbers[1:]` copies, as used in
+python_core.control_flow and python_core.functions, against
+python_core.seqview.SeqView on large inputs.
+
+    python -m benchmarks.bench_seqview [--size N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from array import array
+
+from python_core.seqview import SeqView, maximum, recursive_sum
+
+
+def copying_recursive_sum(numbers):
+    """Reference copy of recursive_sum from python_core.functions"""
+    if not numbers:
+        return 0
+    return numbers[0] + copying_recursive_sum(numbers[1:])
+
+
+def copying_maximum(numbers):
+    """The "maximum in list" loop from python_core.control_flow"""
+    max_num = numbers[0]
+    for num in numbers[1:]:
+        if num > max_num:
+            max_num = num
+    return max_num
+
+
+def measure(func, *args):
+    """
+    Return (result, seconds, peak bytes allocated while running).
+
+    Timing and memory come from separate runs because tracemalloc slows
+    down allocation-heavy code by an order of magnitude.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def report(label, elapsed, peak):
+    print(f"  {label:<28} {elapsed:8.4f} s  peak {peak / 2**20:9.2f} MiB")
+
+
+def bench_tail_slice(name, data):
+    print(f"\n  {name}:")
+    _, t, peak = measure(lambda: data[1:])
+    report("data[1:]", t, peak)
+    _, t, peak = measure(lambda: SeqView(data)[1:])
+    report("SeqView(data)[1:]", t, peak)
+
+
+def bench_maximum(data):
+    expected, t, peak = measure(copying_maximum, data)
+    report("loop over numbers[1:]", t, peak)
+    got, t, peak = measure(maximum, data)
+    assert got == expected
+    report("maximum(SeqView)", t, peak)
+
+
+def bench_recursive_sum(depth):
+    data = list(range(depth))
+    expected, t, peak = measure(copying_recursive_sum, data)
+    report("numbers[1:] recursion", t, peak)
+    got, t, peak = measure(recursive_sum, data)
+    assert got == expected
+    report("SeqView recursion", t, peak)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--depth", type=int, default=900)
+    args = parser.parse_args(argv)
+
+    numbers = list(range(args.size))
+    packed = array("q", numbers)
+
+    print("=" * 60)
+    print(f"TAIL SLICE OF {args.size:,} ELEMENTS")
+    print("=" * 60)
+    bench_tail_slice("list", numbers)
+    bench_tail_slice("array('q')", packed)
+    bench_tail_slice("memoryview", memoryview(packed))
+
+    print("\n" + "=" * 60)
+    print(f"MAXIMUM OF {args.size:,} ELEMENTS")
+    print("=" * 60)
+    bench_maximum(numbers)
+
+    print("\n" + "=" * 60)
+    print(f"RECURSIVE SUM, DEPTH {args.depth}")
+    print("=" * 60)
+    bench_recursive_sum(args.depth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Shared Cache Benchmark
+======================
+Runs the same skewed stream of calls to an expensive function on 1..N worker
+processes, memoized by a per-process lru_cache or by one SharedCache, and
+reports the overall hit rate and throughput of each.
+
+    python -m benchmarks.bench_shared_cache [--calls N] [--keys N] [--max-workers N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from functools import lru_cache
+
+from python_core.shared_cache import SharedCache, shared_cached
+
+_cached = None
+
+
+def expensive(n):
+    """About 50 us of pure-Python work"""
+    total = 0
+    for i in range(400):
+        total = (total * 31 + n + i) % 1_000_003
+    return total
+
+
+def _init_lru(maxsize):
+    global _cached
+    _cached = lru_cache(maxsize=maxsize)(expensive)
+
+
+def _init_shared(cache):
+    global _cached
+    _cached = shared_cached(cache)(expensive)
+
+
+def _run_lru(keys):
+    for k in keys:
+        _cached(k)
+    info = _cached.cache_info()
+    return info.hits, info.misses
+
+
+def _run_shared(keys):
+    cache = _cached.cache
+    before = cache.hits, cache.misses
+    for k in keys:
+        _cached(k)
+    return cache.hits - before[0], cache.misses - before[1]
+
+
+def workload(calls, keys, seed=0):
+    rng = random.Random(seed)
+    weights = [1 / (rank ** 0.8) for rank in range(1, keys + 1)]
+    return rng.choices(range(keys), weights, k=calls)
+
+
+def run(kind, stream, workers, lru_size, cache=None):
+    ctx = multiprocessing.get_context("fork")
+    if kind == "lru":
+        pool = ctx.Pool(workers, _init_lru, (lru_size,))
+        task = _run_lru
+    else:
+        pool = ctx.Pool(workers, _init_shared, (cache,))
+        task = _run_shared
+    shards = [stream[i::workers] for i in range(workers)]
+    with pool:
+        start = time.perf_counter()
+        results = pool.map(task, shards)
+        elapsed = time.perf_counter() - start
+    hits = sum(h for h, _ in results)
+    misses = sum(m for _, m in results)
+    return hits / (hits + misses), len(stream) / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=20_000)
+    parser.add_argument("--lru-size", type=int, default=4096)
+    parser.add_argument("--max-workers", type=int,
+                        default=max(4, os.cpu_count() or 1))
+    args = parser.parse_args(argv)
+
+    stream = workload(args.calls, args.keys)
+    print("=" * 60)
+    print(f"{args.calls:,} CALLS OVER {args.keys:,} KEYS "
+          f"(cpu_count={os.cpu_count()})")
+    print("=" * 60)
+    print(f"  {'workers':>7}  {'lru hit':>8} {'calls/s':>10}   "
+          f"{'shared hit':>10} {'calls/s':>10}")
+    workers = 1
+    while workers <= args.max_workers:
+        lru_rate, lru_speed = run("lru", stream, workers, args.lru_size)
+        cache = SharedCache(capacity=args.lru_size, slot_size=48,
+                            value_format="q",
+                            context=multiprocessing.get_context("fork"))
+        try:
+            shared_rate, shared_speed = run("shared", stream, workers,
+                                            args.lru_size, cache)
+        finally:
+            cache.close()
+            cache.unlink()
+        print(f"  {workers:>7}  {lru_rate:>8.1%} {lru_speed:>10,.0f}   "
+              f"{shared_rate:>10.1%} {shared_speed:>10,.0f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Streaming Statistics Benchmark
+==============================
+Builds Moments and KLL sketches in worker processes, merges them, and
+compares the result with exact statistics over the whole data set. Also
+reports the pickled size that each worker sends back.
+
+    python -m benchmarks.bench_streaming [--events N] [--workers N]
+"""
+
+import argparse
+import bisect
+import os
+import pickle
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from python_core.streaming import KLLSketch, Moments
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def latencies(seed, count):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(3, 1) for _ in range(count)]
+
+
+def summarize_shard(seed, count):
+    """Worker: stream one shard into a Moments and a sketch"""
+    moments = Moments()
+    sketch = KLLSketch(seed=seed)
+    for value in latencies(seed, count):
+        moments.add(value)
+        sketch.add(value)
+    return moments, sketch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    shard = args.events // args.workers
+
+    print("=" * 60)
+    print(f"{shard * args.workers:,} EVENTS OVER {args.workers} WORKER(S)")
+    print("=" * 60)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as pool:
+        parts = list(pool.map(summarize_shard, range(args.workers),
+                              [shard] * args.workers))
+    elapsed = time.perf_counter() - start
+    moments, sketch = Moments(), KLLSketch()
+    for part_moments, part_sketch in parts:
+        moments.merge(part_moments)
+        sketch.merge(part_sketch)
+    payload = len(pickle.dumps(parts[0]))
+    print(f"  streamed in {elapsed:.2f} s, {payload:,} bytes sent per worker")
+    print(f"  merged sketch: {sketch}")
+
+    exact = sorted(v for seed in range(args.workers)
+                   for v in latencies(seed, shard))
+    print("\n  statistic        merged        exact")
+    print(f"  count      {moments.count:>12,} {len(exact):>12,}")
+    print(f"  mean       {moments.mean:12.4f} {statistics.fmean(exact):12.4f}")
+    print(f"  stdev      {moments.stdev:12.4f} {statistics.pstdev(exact):12.4f}")
+    print(f"  max        {moments.max:12.4f} {exact[-1]:12.4f}")
+    for q in QUANTILES:
+        value = sketch.quantile(q)
+        true_value = exact[min(len(exact) - 1, int(q * len(exact)))]
+        rank_error = bisect.bisect_right(exact, value) / len(exact) - q
+        print(f"  p{q * 100:<8g} {value:12.4f} {true_value:12.4f}  "
+              f"rank error {rank_error:+.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Trampoline Benchmark
+====================
+Measures the per-level cost of plain Python recursion against the explicit
+stack in python_core.trampoline at depths up to 10**6.
+
+Plain recursion past the default limit only works after raising
+sys.setrecursionlimit and running in a thread with a large stack; the
+trampolined versions need neither.
+
+    python -m benchmarks.bench_trampoline [--depths 1000 10000 ...]
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from python_core.trampoline import trampoline
+
+
+def plain_depth(n):
+    """Non-tail recursion in the style of python_core.functions"""
+    if n == 0:
+        return 0
+    return 1 + plain_depth(n - 1)
+
+
+@trampoline
+def trampolined_depth(n):
+    if n == 0:
+        return 0
+    return 1 + (yield trampolined_depth.call(n - 1))
+
+
+@trampoline
+def tail_depth(n, acc=0):
+    if n == 0:
+        return acc
+    return tail_depth.call(n - 1, acc + 1)
+
+
+def loop_depth(n):
+    acc = 0
+    while n:
+        n -= 1
+        acc += 1
+    return acc
+
+
+def timed(func, n):
+    start = time.perf_counter()
+    result = func(n)
+    elapsed = time.perf_counter() - start
+    assert result == n
+    return elapsed
+
+
+def run_with_big_stack(depth, func, *args):
+    """Run func in a thread with a 1 GiB stack and room for depth frames"""
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func(*args)
+        except RecursionError as exc:
+            result["error"] = exc
+
+    old_limit = sys.getrecursionlimit()
+    old_size = threading.stack_size(1 << 30)
+    sys.setrecursionlimit(max(old_limit, depth + 1000))
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(old_size)
+        sys.setrecursionlimit(old_limit)
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depths", type=int, nargs="*",
+                        default=[10**3, 10**4, 10**5, 10**6])
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("RECURSION DEPTH: TIME PER LEVEL (ns)")
+    print("=" * 60)
+    print(f"  {'depth':>9}  {'plain':>9}  {'trampoline':>10}  "
+          f"{'tail call':>9}  {'while loop':>10}")
+    for depth in args.depths:
+        plain = run_with_big_stack(depth, timed, plain_depth, depth)
+        tramp = timed(trampolined_depth, depth)
+        tail = timed(tail_depth, depth)
+        loop = timed(loop_depth, depth)
+        print(f"  {depth:>9,}  {plain / depth * 1e9:9.0f}  "
+              f"{tramp / depth * 1e9:10.0f}  {tail / depth * 1e9:9.0f}  "
+              f"{loop / depth * 1e9:10.0f}")
+
+    print(f"\nDefault recursion limit: {sys.getrecursionlimit()}")
+    try:
+        plain_depth(args.depths[-1])
+        print("  plain recursion at max depth: ok")
+    except RecursionError:
+        print("  plain recursion at max depth without tuning: RecursionError")
+    print(f"  trampoline at max depth without tuning: "
+          f"{trampolined_depth(args.depths[-1]):,}")
+
+
+if __name__ == "__main__":
+    main()
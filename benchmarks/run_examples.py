@@ -0,0 +1,132 @@
+"""
+Example Runner
+==============
+Runs every script in examples/ in parallel, each in its own subprocess and
+temporary working directory, and reports wall time, CPU time and peak RSS
+per script. Exits with status 1 if any script fails or times out.
+
+    python -m benchmarks.run_examples [--jobs N] [--timeout S] [--json] [PATTERN ...]
+
+Each script runs in a fresh temp directory, because 07_modules_packages and
+08_file_handling write fixed file names (math_utils.py, example.txt, ...)
+into the current directory and would otherwise collide. Resource usage comes
+from os.wait4, which returns the same struct as resource.getrusage but for
+one child, not all children together.
+"""
+
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def run_example(path, timeout, output_mode):
+    """Run one script and return a result dict"""
+    name = os.path.basename(path)
+    env = dict(os.environ, PYTHON_CORE_OUTPUT=output_mode)
+    with tempfile.TemporaryDirectory(prefix="example-") as cwd, \
+            tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, path], cwd=cwd, env=env,
+                                stdin=subprocess.DEVNULL, stdout=out,
+                                stderr=err)
+        timer = threading.Timer(timeout, os.kill, (proc.pid, signal.SIGKILL))
+        timer.start()
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+        finally:
+            timer.cancel()
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        err.seek(0)
+        stderr = err.read().decode(errors="replace")
+        out.seek(0)
+        stdout_bytes = len(out.read())
+    timed_out = proc.returncode == -signal.SIGKILL and wall >= timeout
+    return {
+        "script": name,
+        "returncode": proc.returncode,
+        "ok": proc.returncode == 0,
+        "timed_out": timed_out,
+        "wall": wall,
+        "user": usage.ru_utime,
+        "system": usage.ru_stime,
+        "cpu": usage.ru_utime + usage.ru_stime,
+        "max_rss": usage.ru_maxrss * _RSS_UNIT,
+        "stdout_bytes": stdout_bytes,
+        "stderr": stderr,
+    }
+
+
+def report(results, total_wall):
+    lines = [f"{'script':<32} {'status':>8} {'wall s':>8} {'cpu s':>8} "
+             f"{'peak RSS MB':>12}"]
+    for r in results:
+        status = "ok" if r["ok"] else ("timeout" if r["timed_out"]
+                                       else f"exit {r['returncode']}")
+        lines.append(f"{r['script']:<32} {status:>8} {r['wall']:>8.3f} "
+                     f"{r['cpu']:>8.3f} {r['max_rss'] / 2**20:>12.1f}")
+    cpu = sum(r["cpu"] for r in results)
+    serial = sum(r["wall"] for r in results)
+    lines.append(f"{'TOTAL':<32} {'':>8} {total_wall:>8.3f} {cpu:>8.3f}")
+    lines.append(f"\nsum of script wall times {serial:.3f} s, "
+                 f"ran in {total_wall:.3f} s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("patterns", nargs="*", default=["*"],
+                        help="glob patterns selecting scripts (default: all)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=120.0,
+                        help="seconds before a script is killed")
+    parser.add_argument("--output", default="buffered",
+                        choices=("buffered", "null", "direct"),
+                        help="PYTHON_CORE_OUTPUT mode for the scripts")
+    parser.add_argument("--json", action="store_true",
+                        help="print results as JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    scripts = sorted(
+        path for path in glob.glob(os.path.join(ROOT, "examples", "[0-9]*.py"))
+        if any(fnmatch.fnmatch(os.path.basename(path), pattern)
+               for pattern in args.patterns))
+    if not scripts:
+        parser.error("no scripts match")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max(1, args.jobs)) as pool:
+        results = list(pool.map(
+            lambda path: run_example(path, args.timeout, args.output),
+            scripts))
+    total_wall = time.perf_counter() - start
+
+    failed = [r for r in results if not r["ok"]]
+    if args.json:
+        print(json.dumps({"total_wall": total_wall, "results": results},
+                         indent=2))
+    else:
+        print(report(results, total_wall))
+        for r in failed:
+            if r["stderr"].strip():
+                print(f"\n--- {r['script']} stderr ---")
+                print(r["stderr"].rstrip()[-2000:])
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
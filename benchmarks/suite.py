@@ -0,0 +1,313 @@
+"""
+Topic Micro-Benchmark Suite
+===========================
+Times the constructs the example topics teach, using python_core.microbench,
+and compares two saved runs for regressions.
+
+    python -m benchmarks.suite run [-o results.json] [--repeat N] [PATTERN ...]
+    python -m benchmarks.suite compare old.json new.json [--alpha A] [--threshold T]
+    python -m benchmarks.suite list
+
+compare exits with status 1 when any benchmark regressed significantly.
+"""
+
+import argparse
+import csv
+import io
+import json
+import pickle
+import random
+import sys
+from collections import Counter, defaultdict
+
+from python_core import microbench
+from python_core.exception_handling import safe_get
+from python_core.functions import factorial, fibonacci
+
+suite = microbench.Suite()
+
+_rng = random.Random(42)
+NUMBERS = list(range(1000))
+WORDS = [_rng.choice(["apple", "banana", "cherry", "date", "elderberry",
+                      "fig", "grape"]) for _ in range(1000)]
+RECORDS = [{"id": i, "name": f"user{i}", "score": _rng.random(),
+            "tags": ["a", "b"]} for i in range(200)]
+LOOKUP = {f"key{i}": i for i in range(100)}
+NAME, AGE = "Alice", 30
+
+
+# ============================================================================
+# COMPREHENSIONS VS LOOPS (basic_syntax, control_flow, advanced_topics)
+# ============================================================================
+
+@suite.bench("comprehension", "for-append")
+def squares_loop():
+    result = []
+    for x in NUMBERS:
+        result.append(x ** 2)
+    return result
+
+
+@suite.bench("comprehension", "list-comprehension")
+def squares_comprehension():
+    return [x ** 2 for x in NUMBERS]
+
+
+@suite.bench("comprehension", "map-lambda")
+def squares_map():
+    return list(map(lambda x: x ** 2, NUMBERS))
+
+
+@suite.bench("comprehension", "filtered-comprehension")
+def even_squares_comprehension():
+    return [x ** 2 for x in NUMBERS if x % 2 == 0]
+
+
+@suite.bench("comprehension", "filtered-loop")
+def even_squares_loop():
+    result = []
+    for x in NUMBERS:
+        if x % 2 == 0:
+            result.append(x ** 2)
+    return result
+
+
+# ============================================================================
+# COUNTING (data_structures, standard_library)
+# ============================================================================
+
+@suite.bench("counting", "if-in")
+def count_if_in():
+    counts = {}
+    for w in WORDS:
+        if w in counts:
+            counts[w] += 1
+        else:
+            counts[w] = 1
+    return counts
+
+
+@suite.bench("counting", "dict.get")
+def count_get():
+    counts = {}
+    for w in WORDS:
+        counts[w] = counts.get(w, 0) + 1
+    return counts
+
+
+@suite.bench("counting", "defaultdict")
+def count_defaultdict():
+    counts = defaultdict(int)
+    for w in WORDS:
+        counts[w] += 1
+    return counts
+
+
+@suite.bench("counting", "Counter")
+def count_counter():
+    return Counter(WORDS)
+
+
+# ============================================================================
+# RECURSION VS ITERATION (functions)
+# ============================================================================
+
+def factorial_iterative(n):
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def fibonacci_iterative(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+@suite.bench("recursion", "factorial-recursive")
+def bench_factorial_recursive():
+    return factorial(100)
+
+
+@suite.bench("recursion", "factorial-iterative")
+def bench_factorial_iterative():
+    return factorial_iterative(100)
+
+
+@suite.bench("recursion", "fibonacci-recursive")
+def bench_fibonacci_recursive():
+    return fibonacci(15)
+
+
+@suite.bench("recursion", "fibonacci-iterative")
+def bench_fibonacci_iterative():
+    return fibonacci_iterative(15)
+
+
+# ============================================================================
+# STRING FORMATTING (basic_syntax)
+# ============================================================================
+
+@suite.bench("formatting", "f-string")
+def format_fstring():
+    return f"Name: {NAME}, Age: {AGE}"
+
+
+@suite.bench("formatting", "str.format")
+def format_method():
+    return "Name: {}, Age: {}".format(NAME, AGE)
+
+
+@suite.bench("formatting", "percent")
+def format_percent():
+    return "Name: %s, Age: %d" % (NAME, AGE)
+
+
+@suite.bench("formatting", "concatenation")
+def format_concat():
+    return "Name: " + NAME + ", Age: " + str(AGE)
+
+
+@suite.bench("formatting", "join-1000")
+def format_join():
+    return ", ".join(WORDS)
+
+
+@suite.bench("formatting", "concat-loop-1000")
+def format_concat_loop():
+    text = ""
+    for w in WORDS:
+        text += w + ", "
+    return text
+
+
+# ============================================================================
+# safe_get: try/except VS in (exception_handling)
+# ============================================================================
+
+def safe_get_in(dictionary, key, default=None):
+    return dictionary[key] if key in dictionary else default
+
+
+@suite.bench("safe_get", "try-hit")
+def safe_get_try_hit():
+    return safe_get(LOOKUP, "key50")
+
+
+@suite.bench("safe_get", "try-miss")
+def safe_get_try_miss():
+    return safe_get(LOOKUP, "missing")
+
+
+@suite.bench("safe_get", "in-hit")
+def safe_get_in_hit():
+    return safe_get_in(LOOKUP, "key50")
+
+
+@suite.bench("safe_get", "in-miss")
+def safe_get_in_miss():
+    return safe_get_in(LOOKUP, "missing")
+
+
+@suite.bench("safe_get", "dict.get-miss")
+def safe_get_builtin_miss():
+    return LOOKUP.get("missing")
+
+
+# ============================================================================
+# SERIALIZATION ROUND-TRIPS (advanced_topics, standard_library)
+# ============================================================================
+
+@suite.bench("serialization", "json")
+def roundtrip_json():
+    return json.loads(json.dumps(RECORDS))
+
+
+@suite.bench("serialization", "pickle")
+def roundtrip_pickle():
+    return pickle.loads(pickle.dumps(RECORDS, pickle.HIGHEST_PROTOCOL))
+
+
+@suite.bench("serialization", "csv")
+def roundtrip_csv():
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["id", "name", "score"],
+                            extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(RECORDS)
+    buffer.seek(0)
+    return list(csv.DictReader(buffer))
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _run(args):
+    def progress(key, result):
+        print(f"  {key:<40} {microbench.format_ns(result['median_ns']):>10}"
+              f"  +/- {microbench.format_ns(result['stdev_ns']):>9}"
+              f"  ({len(result['rejected_ns'])} outliers)", file=sys.stderr)
+
+    document = suite.run(args.patterns, repeat=args.repeat,
+                         warmup=args.warmup, min_time=args.min_time,
+                         progress=progress)
+    if args.output:
+        microbench.save(document, args.output)
+        print(f"saved {len(document['results'])} results to {args.output}",
+              file=sys.stderr)
+    else:
+        print(json.dumps(document, indent=2))
+
+
+def _compare(args):
+    old, new = microbench.load(args.old), microbench.load(args.new)
+    rows = microbench.compare(old, new, args.alpha, args.threshold)
+    print(f"{'benchmark':<40} {'old':>10} {'new':>10} {'change':>8} "
+          f"{'p':>8}  verdict")
+    for key, before, after, change, p, verdict in rows:
+        print(f"{key:<40} {microbench.format_ns(before):>10} "
+              f"{microbench.format_ns(after):>10} {change:>+8.1%} "
+              f"{p:>8.4f}  {verdict}")
+    regressions = [row for row in rows if row[-1] == "regression"]
+    print(f"\n{len(regressions)} regression(s), "
+          f"{sum(row[-1] == 'improvement' for row in rows)} improvement(s) "
+          f"of {len(rows)} (alpha={args.alpha}, threshold={args.threshold:.0%})")
+    if regressions:
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure and save results")
+    run.add_argument("patterns", nargs="*",
+                     help="glob patterns over group/name (default: all)")
+    run.add_argument("-o", "--output", help="JSON file (default: stdout)")
+    run.add_argument("--repeat", type=int, default=20)
+    run.add_argument("--warmup", type=int, default=3)
+    run.add_argument("--min-time", type=float, default=0.01,
+                     help="seconds per sample after calibration")
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser("compare", help="flag regressions")
+    cmp.add_argument("old")
+    cmp.add_argument("new")
+    cmp.add_argument("--alpha", type=float, default=0.01)
+    cmp.add_argument("--threshold", type=float, default=0.05,
+                     help="minimum relative change of the median")
+    cmp.set_defaults(handler=_compare)
+
+    listing = commands.add_parser("list", help="list benchmark names")
+    listing.set_defaults(handler=lambda args: print(
+        "\n".join(b.key for b in suite.benchmarks)))
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Example Script Helper
+=====================
+The scripts in this directory hold no code of their own. Each one passes
+its __file__ to run(), which picks the python_core topic module by the
+script's number and runs it the way `python -m python_core NN` does.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(script):
+    """Run the demonstrations of the topic behind an examples/NN_*.py path"""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    from python_core.__main__ import main
+    main([os.path.basename(script)[:2]])
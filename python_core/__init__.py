@@ -0,0 +1,15 @@
+"""
+Python Core
+===========
+Reusable, importable implementations of the techniques shown in examples/.
+
+Each submodule is independent and only imports the standard library, so
+importing the package itself is cheap:
+
+    from python_core.primes import primes_between, is_prime
+
+The code of each example script lives in a topic module (basic_syntax,
+functions, oop, ...), whose demonstrations run from main():
+
+    python -m python_core functions
+"""
@@ -0,0 +1,70 @@
+"""
+Topic Runner
+============
+Run the demonstrations of one or more topic modules:
+
+    python -m python_core                      # list the topics
+    python -m python_core functions oop        # run them in order
+    python -m python_core 04                   # by example number
+    python -m python_core all
+
+Output goes through python_core.output, so PYTHON_CORE_OUTPUT=null times
+the demonstrations without their printing.
+"""
+
+import argparse
+import importlib
+import sys
+
+from python_core.output import install_output
+
+# Topic modules in the order of the scripts in examples/.
+TOPICS = (
+    "basic_syntax",
+    "variables_operators",
+    "control_flow",
+    "functions",
+    "data_structures",
+    "oop",
+    "modules_packages",
+    "file_handling",
+    "exception_handling",
+    "advanced_topics",
+    "standard_library",
+)
+
+
+def resolve(name):
+    """Topic module name for a topic name or example number"""
+    if name.isdigit() and 1 <= int(name) <= len(TOPICS):
+        return TOPICS[int(name) - 1]
+    if name in TOPICS:
+        return name
+    raise ValueError(f"unknown topic {name!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m python_core",
+        description="Run the demonstrations of python_core topic modules.")
+    parser.add_argument("topics", nargs="*",
+                        help="topic names or example numbers, or 'all'")
+    args = parser.parse_args(argv)
+
+    if not args.topics:
+        for number, topic in enumerate(TOPICS, 1):
+            print(f"{number:02}  {topic}")
+        return
+    try:
+        names = (TOPICS if args.topics == ["all"]
+                 else [resolve(name) for name in args.topics])
+    except ValueError as exc:
+        parser.error(str(exc))
+    install_output()
+    for name in names:
+        importlib.import_module(f"python_core.{name}").main()
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Single-Flight Async Memoization
+===============================
+`async_cached` memoizes `async def` functions. Concurrent callers asking for
+the same key share one in-flight computation instead of each starting their
+own:
+
+    @async_cached(ttl=60, negative_ttl=5)
+    async def fetch_user(user_id):
+        ...
+
+    # 1000 tasks, one request per distinct user_id
+    await asyncio.gather(*(fetch_user(i % 10) for i in range(1000)))
+    fetch_user.cache_info()
+    # AsyncCacheInfo(hits=0, misses=10, coalesced=990, negative_hits=0, ...)
+
+- Results are kept for `ttl` seconds (None = until evicted), in a
+  `python_core.cache.Cache` bounded by `max_entries` and `max_bytes`.
+- Exceptions are the negative results. Every caller waiting on the failed
+  computation receives the exception. For `negative_ttl` seconds afterwards
+  each call raises a fresh copy of it, chained from the original, without
+  calling the function again. The default of 0 retries on the next call.
+- The shared computation runs as its own task. A caller that is cancelled
+  stops waiting without cancelling the work for everyone else.
+"""
+
+import asyncio
+import copy
+from collections import namedtuple
+from functools import wraps
+
+from python_core.cache import Cache, make_key
+
+AsyncCacheInfo = namedtuple(
+    "AsyncCacheInfo",
+    "hits misses coalesced negative_hits entries in_flight")
+
+_MISSING = object()
+
+
+class _Failed:
+    """A cached exception"""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc):
+        self.exc = exc
+
+    def fresh(self):
+        """
+        A copy to raise, so the cached exception's traceback does not grow
+        by the frames of every caller it is raised in.
+        """
+        try:
+            return copy.copy(self.exc).with_traceback(None)
+        except Exception:
+            return None
+
+
+def async_cached(ttl=None, *, negative_ttl=0, max_entries=None,
+                 max_bytes=None, policy="lru", key=make_key):
+    """
+    Decorator for coroutine functions with single-flight memoization.
+
+    Args:
+        ttl: Seconds a result stays cached (None = no expiry)
+        negative_ttl: Seconds a raised exception stays cached (0 = not cached)
+        max_entries, max_bytes, policy: Bounds of the result Cache
+        key: Function of the call's arguments returning a hashable key
+
+    The wrapper gains .cache, .cache_info() and .cache_clear().
+    """
+    def decorator(func):
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError(f"{func.__qualname__} is not an async function")
+        results = Cache(max_bytes, max_entries, ttl, policy)
+        failures = Cache(ttl=negative_ttl, sizeof=lambda value: 0)
+        in_flight = {}
+        counters = {"hits": 0, "misses": 0, "coalesced": 0,
+                    "negative_hits": 0}
+
+        def finished(k, task):
+            in_flight.pop(k, None)
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if exc is None:
+                results.put(k, task.result())
+            elif negative_ttl:
+                failures.put(k, _Failed(exc))
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            value = results.get(k, _MISSING, count=False)
+            if value is not _MISSING:
+                counters["hits"] += 1
+                return value
+            if negative_ttl:
+                failed = failures.get(k, count=False)
+                if failed is not None:
+                    counters["negative_hits"] += 1
+                    exc = failed.fresh()
+                    if exc is None:
+                        raise failed.exc.with_traceback(None)
+                    raise exc from failed.exc
+            task = in_flight.get(k)
+            if task is None:
+                counters["misses"] += 1
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[k] = task
+                task.add_done_callback(lambda t: finished(k, t))
+            else:
+                counters["coalesced"] += 1
+            return await asyncio.shield(task)
+
+        def cache_info():
+            return AsyncCacheInfo(counters["hits"], counters["misses"],
+                                  counters["coalesced"],
+                                  counters["negative_hits"], len(results),
+                                  len(in_flight))
+
+        def cache_clear():
+            results.clear()
+            failures.clear()
+
+        wrapper.cache = results
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
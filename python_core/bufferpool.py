@@ -0,0 +1,119 @@
+"""
+Buffer Pool
+===========
+Reads binary files into preallocated buffers instead of new bytes objects.
+
+The BINARY FILES section of python_core.file_handling reads with
+`f.read()`, which allocates a fresh bytes object on every call. A
+BufferPool allocates its bytearrays once. stream() fills them with
+readinto() and yields memoryviews of the filled part:
+
+    pool = BufferPool(count=4, size=1 << 20)
+    with open("data.bin", "rb", buffering=0) as f:
+        for view in pool.stream(f):
+            crc = zlib.crc32(view, crc)
+
+Each view is released, and its buffer returned to the pool, when the next
+block is requested or the loop ends. A view kept past that point raises
+ValueError on use; call bytes(view) to keep a copy. Slices such as
+view[:4] are separate exports of the buffer and outlive that release, so
+a buffer returned while anything still exports it is dropped and replaced
+with a new one: the slice keeps its block's bytes instead of showing the
+next block's. In steady state the only allocation per block is the small
+memoryview object itself.
+
+acquire() and release() hand out buffers directly, for code that fills
+several at once or passes them between threads. acquire() blocks while
+the pool is empty, which also bounds how much data is in flight.
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+DEFAULT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def _exported(buffer):
+    """True while a memoryview still exports buffer"""
+    # A bytearray with exports cannot be resized. Shrinking by one byte
+    # and growing back stays within its allocation, so this is O(1).
+    try:
+        last = buffer.pop()
+    except BufferError:
+        return True
+    buffer.append(last)
+    return False
+
+
+class BufferPool:
+    """A fixed set of equally sized bytearrays shared between threads"""
+
+    def __init__(self, count=4, size=DEFAULT_BUFFER_SIZE):
+        if count < 1 or size < 1:
+            raise ValueError("count and size must be at least 1")
+        self.count = count
+        self.size = size
+        self._free = deque(bytearray(size) for _ in range(count))
+        self._ids = {id(buffer) for buffer in self._free}
+        self._ready = threading.Condition(threading.Lock())
+        self.replaced = 0
+
+    @property
+    def available(self):
+        return len(self._free)
+
+    def acquire(self, timeout=None):
+        """Take a buffer, waiting up to timeout seconds for one"""
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._free, timeout):
+                raise TimeoutError("no buffer became available")
+            return self._free.pop()
+
+    def release(self, buffer):
+        """Give a buffer back to the pool"""
+        if id(buffer) not in self._ids:
+            raise ValueError("buffer does not belong to this pool")
+        with self._ready:
+            if any(free is buffer for free in self._free):
+                raise ValueError("buffer released twice")
+            if _exported(buffer):
+                # Still visible through a memoryview: never refill it.
+                self._ids.discard(id(buffer))
+                buffer = bytearray(self.size)
+                self._ids.add(id(buffer))
+                self.replaced += 1
+            self._free.append(buffer)
+            self._ready.notify()
+
+    @contextmanager
+    def buffer(self, timeout=None):
+        """Context manager around acquire() and release()"""
+        buffer = self.acquire(timeout)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def stream(self, f, timeout=None):
+        """
+        Yield a memoryview per block read from f with readinto().
+        Open f with buffering=0 so blocks go straight into the pool's
+        buffers instead of through the file's own buffer.
+        """
+        while True:
+            buffer = self.acquire(timeout)
+            try:
+                n = f.readinto(buffer)
+                if not n:
+                    return
+                view = memoryview(buffer)
+                if n < self.size:
+                    with view:
+                        view = view[:n]
+                try:
+                    yield view
+                finally:
+                    view.release()
+            finally:
+                self.release(buffer)
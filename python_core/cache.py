@@ -0,0 +1,451 @@
+"""
+Size-Aware Caching
+==================
+A thread-safe in-memory cache with byte budgets, TTL and pluggable eviction.
+The `cached` decorator replaces `functools.lru_cache` where that is not
+enough.
+
+`@lru_cache(maxsize=128)` in python_core.advanced_topics and
+python_core.standard_library bounds the number of entries, not their size,
+never expires anything and cannot take list or dict arguments. Here:
+
+    @cached(max_bytes=64 * 2**20, ttl=300, policy="tinylfu")
+    def load_report(filters):          # filters may be a dict
+        ...
+
+    load_report.cache_info()
+    # CacheInfo(hits=..., misses=..., evictions=..., expirations=...,
+    #           entries=..., bytes=..., max_bytes=67108864)
+
+Policies:
+
+- "lru"     - evict the least recently used entry
+- "lfu"     - evict the least frequently used entry (O(1) frequency lists)
+- "tinylfu" - W-TinyLFU. A small LRU window admits new keys. A segmented
+  LRU main area holds the rest, and a count-min sketch of recent access
+  frequency decides which of the two candidates is evicted. It resists
+  one-off scans that would flush an LRU.
+
+Entry sizes come from `deep_sizeof` by default. Pass `sizeof=` to use a
+cheaper or more exact measure.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    "hits misses evictions expirations entries bytes max_bytes")
+
+_MISSING = object()
+
+
+# ============================================================================
+# SIZES AND KEYS
+# ============================================================================
+
+def deep_sizeof(obj, _seen=None):
+    """sys.getsizeof of obj plus everything reachable through containers"""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += deep_sizeof(k, _seen) + deep_sizeof(v, _seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_sizeof(item, _seen)
+    elif hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), _seen)
+    return size
+
+
+def _freeze(value):
+    """Hashable stand-in for lists, dicts and sets (tagged by type)"""
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(k), _freeze(v))
+                                for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    return value
+
+
+class _KwargsMark:
+    """Separates positional from keyword arguments in a key. A class, so it
+    pickles by name and keys stay stable across processes."""
+
+
+def make_key(*args, **kwargs):
+    """
+    Default cache key: the arguments themselves when hashable, otherwise a
+    frozen copy in which lists, dicts and sets become tuples and frozensets.
+    """
+    key = args
+    if kwargs:
+        # Without the mark f((1,), (("a", 2),)) and f(1, a=2) would collide.
+        key += (_KwargsMark,) + tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return _freeze(key)
+
+
+# ============================================================================
+# EVICTION POLICIES
+# ============================================================================
+
+class LRUPolicy:
+    """Least recently used"""
+
+    def __init__(self):
+        self._order = OrderedDict()
+
+    def insert(self, key):
+        self._order[key] = None
+
+    def access(self, key):
+        self._order.move_to_end(key)
+
+    def remove(self, key):
+        del self._order[key]
+
+    def victim(self):
+        return next(iter(self._order))
+
+    def clear(self):
+        self._order.clear()
+
+
+class LFUPolicy:
+    """
+    Least frequently used, ties broken by recency. Operations are O(1),
+    except victim() right after remove() emptied the lowest count, which
+    scans the distinct counts once to find the new minimum.
+    """
+
+    def __init__(self):
+        self._freq = {}                 # key -> count
+        self._buckets = {}              # count -> OrderedDict of keys
+        self._min = 0
+
+    def _bucket(self, count):
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            bucket = self._buckets[count] = OrderedDict()
+        return bucket
+
+    def insert(self, key):
+        self._freq[key] = 1
+        self._bucket(1)[key] = None
+        self._min = 1
+
+    def access(self, key):
+        count = self._freq[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min == count:
+                self._min = count + 1
+        self._freq[key] = count + 1
+        self._bucket(count + 1)[key] = None
+
+    def remove(self, key):
+        count = self._freq.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min == count:
+                # Found lazily: an eviction is usually followed by an
+                # insert, which resets the minimum to 1 anyway.
+                self._min = None
+
+    def victim(self):
+        if self._min is None:
+            self._min = min(self._buckets, default=0)
+        return next(iter(self._buckets[self._min]))
+
+    def clear(self):
+        self._freq.clear()
+        self._buckets.clear()
+        self._min = 0
+
+
+class _FrequencySketch:
+    """4-row count-min sketch of 4-bit counters with periodic halving (aging)"""
+
+    def __init__(self, width=1024):
+        self.width = 1 << min(16, max(4, (width - 1).bit_length()))
+        self.mask = self.width - 1
+        self.rows = [[0] * self.width for _ in range(4)]
+        self.additions = 0
+        self.sample_size = 10 * self.width
+
+    def _indexes(self, key):
+        # One multiplicative hash split into four 16-bit row indexes.
+        h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        mask = self.mask
+        return h & mask, (h >> 16) & mask, (h >> 32) & mask, (h >> 48) & mask
+
+    def increment(self, key):
+        for row, i in zip(self.rows, self._indexes(key)):
+            if row[i] < 15:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.additions //= 2
+            self.rows = [[c >> 1 for c in row] for row in self.rows]
+
+    def frequency(self, key):
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+
+
+class TinyLFUPolicy:
+    """
+    W-TinyLFU: an LRU window (about 1% of entries) in front of a segmented
+    LRU main area (probation + protected), with admission to the main area
+    decided by sketched access frequency.
+    """
+
+    WINDOW_FRACTION = 0.01
+    PROTECTED_FRACTION = 0.8
+
+    def __init__(self, expected_entries=1024):
+        self._sketch = _FrequencySketch(expected_entries)
+        self._window = OrderedDict()
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+
+    def _size(self):
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def insert(self, key):
+        self._sketch.increment(key)
+        self._window[key] = None
+        limit = max(1, int(self._size() * self.WINDOW_FRACTION))
+        while len(self._window) > limit:
+            # Window overflow becomes the newest probation entry, where it
+            # is the candidate in the next eviction contest.
+            moved, _ = self._window.popitem(last=False)
+            self._probation[moved] = None
+
+    def access(self, key):
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        else:
+            del self._probation[key]
+            self._protected[key] = None
+            limit = max(1, int(self._size() * self.PROTECTED_FRACTION))
+            while len(self._protected) > limit:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def remove(self, key):
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+        raise KeyError(key)
+
+    def victim(self):
+        if not self._probation:
+            if self._protected:
+                return next(iter(self._protected))
+            return next(iter(self._window))
+        victim = next(iter(self._probation))
+        candidate = next(reversed(self._probation))
+        # The newcomer stays only if it is accessed more often than the
+        # main area's weakest entry; otherwise it is the one evicted.
+        if self._sketch.frequency(candidate) > self._sketch.frequency(victim):
+            return victim
+        return candidate
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+
+
+POLICIES = {"lru": LRUPolicy, "lfu": LFUPolicy, "tinylfu": TinyLFUPolicy}
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class Cache:
+    """
+    Thread-safe mapping with a byte budget, an entry budget and TTL.
+
+    Args:
+        max_bytes: Evict until the summed entry sizes fit (None = no limit)
+        max_entries: Evict until at most this many entries (None = no limit)
+        ttl: Seconds an entry stays valid after being stored (None = forever)
+        policy: "lru", "lfu", "tinylfu", or a policy instance
+        sizeof: Function giving an entry's size in bytes
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None, ttl=None,
+                 policy="lru", sizeof=deep_sizeof, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        if isinstance(policy, str):
+            try:
+                policy = POLICIES[policy]()
+            except KeyError:
+                raise ValueError(f"unknown policy {policy!r}; "
+                                 f"choose from {sorted(POLICIES)}") from None
+        self.policy = policy
+        self._entries = {}          # key -> (value, size, expires_at)
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        # A membership test is not a use: it leaves the policy untouched.
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[2] is None
+                                          or entry[2] > self.clock())
+
+    def _drop(self, key):
+        value, size, _ = self._entries.pop(key)
+        self.policy.remove(key)
+        self.bytes -= size
+
+    def get(self, key, default=None, *, count=True):
+        """Value for key, or default if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None \
+                    and entry[2] <= self.clock():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return default
+            if count:
+                self.hits += 1
+            self.policy.access(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Store value under key, evicting as needed.
+
+        Returns False if the value alone exceeds max_bytes. Nothing is
+        stored then, and any previous value for key is dropped so it cannot
+        be served stale.
+        """
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return False
+        expires = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, expires)
+            self.bytes += size
+            self.policy.insert(key)
+            self._evict()
+        return True
+
+    def _evict(self):
+        while ((self.max_bytes is not None and self.bytes > self.max_bytes)
+               or (self.max_entries is not None
+                   and len(self._entries) > self.max_entries)):
+            self._drop(self.policy.victim())
+            self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+                return True
+            return False
+
+    def purge_expired(self):
+        """Drop every expired entry now rather than on next access"""
+        now = self.clock()
+        with self._lock:
+            expired = [k for k, (_, _, exp) in self._entries.items()
+                       if exp is not None and exp <= now]
+            for key in expired:
+                self._drop(key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.policy.clear()
+            self.bytes = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.expirations, len(self._entries), self.bytes,
+                             self.max_bytes)
+
+
+def cached(max_bytes=None, *, max_entries=None, ttl=None, policy="lru",
+           key=make_key, sizeof=deep_sizeof):
+    """
+    Decorator caching a function's results in its own Cache.
+
+    Args:
+        key: Function called with the same arguments as the decorated
+            function, returning a hashable cache key. The default accepts
+            lists, dicts and sets.
+        Other arguments are passed to Cache.
+
+    The wrapper gains .cache, .cache_info() and .cache_clear(). Used bare,
+    as @cached, the cache has no size or entry limit.
+    """
+    if callable(max_bytes):
+        return cached()(max_bytes)
+
+    def decorator(func):
+        cache = Cache(max_bytes, max_entries, ttl, policy, sizeof)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            value = cache.get(k, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(k, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,250 @@
+"""
+Persistent Memoization
+======================
+`disk_cached` memoizes a function in an SQLite file, so results survive
+process restarts:
+
+    @disk_cached(max_bytes=512 * 2**20)
+    def fibonacci_cached(n):
+        if n < 2:
+            return n
+        return fibonacci_cached(n - 1) + fibonacci_cached(n - 2)
+
+Entries are keyed by the function's qualified name, a hash of its source
+code and a digest of its arguments. When the function's source changes,
+every result stored under the old hash is deleted the first time the new
+version is decorated. Values are pickled. The file is shared safely by
+threads and processes. When the stored values outgrow `max_bytes`, the
+least recently used entries are evicted.
+
+The default file is ~/.cache/python_core/memo.sqlite3, or memo.sqlite3 in
+$PYTHON_CORE_CACHE_DIR when that is set.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+from python_core.cache import CacheInfo, make_key
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+# Rows deleted per eviction round once the file is over budget.
+_EVICT_BATCH = 64
+# What storing a result can raise: pickle fails with PicklingError,
+# TypeError or AttributeError depending on the object, deep structures
+# with RecursionError, and a locked or full file with sqlite3.Error.
+_STORE_ERRORS = (pickle.PicklingError, TypeError, AttributeError,
+                 RecursionError, sqlite3.Error)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest   BLOB PRIMARY KEY,
+    func     TEXT NOT NULL,
+    version  TEXT NOT NULL,
+    value    BLOB NOT NULL,
+    size     INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_func ON entries (func, version);
+CREATE TABLE IF NOT EXISTS meta (total INTEGER NOT NULL);
+INSERT INTO meta SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM meta);
+CREATE TRIGGER IF NOT EXISTS entries_added AFTER INSERT ON entries
+BEGIN UPDATE meta SET total = total + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_removed AFTER DELETE ON entries
+BEGIN UPDATE meta SET total = total - OLD.size; END;
+"""
+
+
+def default_path():
+    directory = os.environ.get("PYTHON_CORE_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "python_core")
+    return os.path.join(directory, "memo.sqlite3")
+
+
+def source_hash(func):
+    """Hash of a function's source, or of its bytecode if that is missing"""
+    try:
+        text = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = func.__code__
+        text = code.co_code + repr(code.co_consts).encode()
+    return hashlib.sha256(text).hexdigest()[:16]
+
+
+def _canonical(value):
+    """Like cache._freeze, but with sets and dicts in a stable order, so
+    the pickle is identical in every process whatever PYTHONHASHSEED is"""
+    if isinstance(value, dict):
+        items = [(_canonical(k), _canonical(v)) for k, v in value.items()]
+        return (dict, tuple(sorted(items, key=pickle.dumps)))
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical(v) for v in value]
+        return (type(value), tuple(sorted(items, key=pickle.dumps)))
+    if isinstance(value, list):
+        return (list, tuple(_canonical(v) for v in value))
+    if isinstance(value, tuple):
+        return tuple(_canonical(v) for v in value)
+    return value
+
+
+class DiskCache:
+    """
+    SQLite-backed store of pickled values with a byte budget.
+
+    Args:
+        path: Database file (created with its directory if missing)
+        max_bytes: Evict least recently used entries above this total size
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or default_path()
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        """One connection per thread, reopened after fork"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, digest):
+        """(True, value) if digest is stored, else (False, None)"""
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM entries WHERE digest = ?",
+                           (digest,)).fetchone()
+        if row is None:
+            return False, None
+        conn.execute("UPDATE entries SET accessed = ? WHERE digest = ?",
+                     (time.time(), digest))
+        return True, pickle.loads(row[0])
+
+    def put(self, digest, func, version, value):
+        """Store value; returns the number of entries evicted to make room"""
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return 0
+        conn = self._connect()
+        evicted = 0
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            conn.execute("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                         (digest, func, version, blob, len(blob), time.time()))
+            while conn.execute("SELECT total FROM meta").fetchone()[0] \
+                    > self.max_bytes:
+                evicted += conn.execute(
+                    "DELETE FROM entries WHERE digest IN (SELECT digest FROM "
+                    "entries ORDER BY accessed LIMIT ?)",
+                    (_EVICT_BATCH,)).rowcount
+        return evicted
+
+    def invalidate(self, func, keep_version=None):
+        """Delete func's entries, except those stored under keep_version"""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM entries WHERE func = ? AND version IS NOT ?",
+                (func, keep_version)).rowcount
+
+    def usage(self, func=None, version=None):
+        """(entries, bytes) overall, or for one function version"""
+        conn = self._connect()
+        if func is None:
+            count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total = conn.execute("SELECT total FROM meta").fetchone()[0]
+            return count, total
+        return conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries "
+            "WHERE func = ? AND version = ?", (func, version)).fetchone()
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _store(path, max_bytes):
+    """Share one DiskCache per file within a process"""
+    path = os.path.abspath(path or default_path())
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = DiskCache(path, max_bytes)
+        store.max_bytes = max(store.max_bytes, max_bytes)
+        return store
+
+
+def disk_cached(path=None, *, max_bytes=DEFAULT_MAX_BYTES, key=make_key):
+    """
+    Decorator memoizing a function's pickled results on disk.
+
+    Args:
+        path: SQLite file to use (default: see module docstring)
+        max_bytes: Size budget for the whole file
+        key: Function called with the call's arguments, returning the value
+            that identifies the call. The default accepts lists, dicts and
+            sets.
+
+    The wrapper gains .cache (the DiskCache), .cache_info() with this
+    process's hits and misses, and .cache_clear() for this function only.
+    A result that cannot be pickled or written is returned uncached;
+    .cache_errors() counts those calls.
+    """
+    def decorator(func):
+        store = _store(path, max_bytes)
+        name = f"{func.__module__}.{func.__qualname__}"
+        version = source_hash(func)
+        store.invalidate(name, keep_version=version)
+        prefix = f"{name}:{version}:".encode()
+        counters = {"hits": 0, "misses": 0, "evictions": 0, "errors": 0}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            call = _canonical(key(*args, **kwargs))
+            digest = hashlib.sha256(
+                prefix + pickle.dumps(call, 4)).digest()
+            found, value = store.get(digest)
+            if found:
+                counters["hits"] += 1
+                return value
+            counters["misses"] += 1
+            value = func(*args, **kwargs)
+            try:
+                counters["evictions"] += store.put(digest, name, version,
+                                                   value)
+            except _STORE_ERRORS:
+                # The call succeeded; only caching it failed.
+                counters["errors"] += 1
+            return value
+
+        def cache_info():
+            entries, size = store.usage(name, version)
+            return CacheInfo(counters["hits"], counters["misses"],
+                             counters["evictions"], 0, entries, size,
+                             store.max_bytes)
+
+        wrapper.cache = store
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = lambda: store.invalidate(name)
+        wrapper.cache_errors = lambda: counters["errors"]
+        return wrapper
+
+    return decorator
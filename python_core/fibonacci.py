@@ -0,0 +1,78 @@
+"""
+Fast Fibonacci
+==============
+Big-integer Fibonacci numbers by fast doubling, using O(log n)
+multiplications and no recursion:
+
+    F(2k)   = F(k) * (2*F(k+1) - F(k))
+    F(2k+1) = F(k)**2 + F(k+1)**2
+
+Compare with python_core.functions, where `fibonacci` is exponential, and
+python_core.advanced_topics, where `fibonacci_cached` recurses n frames
+deep and raises RecursionError near n = 1000.
+
+    >>> fibonacci(90)
+    2880067194370816120
+    >>> fibonacci_many([10, 5, 10, 0])
+    [55, 5, 55, 0]
+"""
+
+
+def _check_index(n):
+    if n < 0:
+        raise ValueError("n must be non-negative")
+
+
+def fibonacci_pair(n):
+    """Return (F(n), F(n+1)) by walking the bits of n from the top"""
+    _check_index(n)
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # (a, b) = (F(k), F(k+1)) -> (F(2k), F(2k+1))
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci(n):
+    """Return the nth Fibonacci number (F(0) = 0, F(1) = 1)"""
+    return fibonacci_pair(n)[0]
+
+
+def _advance(pair, gap):
+    """Given (F(m), F(m+1)), return (F(m+gap), F(m+gap+1))"""
+    fm, fm1 = pair
+    fg, fg1 = fibonacci_pair(gap)
+    # F(m+g) = F(m+1)F(g) + F(m)F(g-1), with F(g-1) = F(g+1) - F(g)
+    low = fm * fg
+    return fm1 * fg + fm * fg1 - low, fm1 * fg1 + low
+
+
+def fibonacci_many(ns):
+    """
+    Return [F(n) for n in ns], sharing work between the queries.
+
+    Queries are answered in ascending order. Each one starts from the
+    previous answer and jumps forward by the gap, which costs a Fibonacci
+    pair of the gap's size plus four multiplications. When the gap is at
+    least as large as the previous index, computing from scratch is cheaper
+    and is used instead.
+    """
+    ns = list(ns)
+    for n in ns:
+        _check_index(n)
+    results = {}
+    current, pair = 0, (0, 1)
+    for n in sorted(set(ns)):
+        gap = n - current
+        if gap >= current:
+            pair = fibonacci_pair(n)
+        else:
+            pair = _advance(pair, gap)
+        current = n
+        results[n] = pair[0]
+    return [results[n] for n in ns]
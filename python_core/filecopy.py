@@ -0,0 +1,234 @@
+"""
+Kernel-Assisted File Copy
+=========================
+Copies files without passing their contents through Python objects.
+
+Example 3 in python_core.file_handling copies with
+`dst.write(src.read())`, which holds the whole file in memory as one str.
+copy_file() asks the kernel to move the bytes instead, trying in order:
+
+1. os.copy_file_range (Linux): the data never leaves the kernel. Some
+   filesystems clone the extents (Btrfs, XFS reflinks) or copy on the
+   server (NFS 4.2), so no data moves at all.
+2. os.sendfile (Linux, macOS): kernel-to-kernel copy through the page
+   cache.
+3. readinto() into one reused buffer, then write() of a memoryview of
+   it. This works everywhere and holds at most block_size bytes.
+
+A method that is unsupported for a pair of files (a different filesystem,
+an old kernel, a special file) hands over at the offset where it stopped.
+If the last allowed method cannot continue either, OSError is raised.
+
+Sparse files keep their holes. When the source has fewer allocated
+blocks than its size suggests, only the data regions found with
+SEEK_DATA/SEEK_HOLE are copied. The destination is then extended to the
+full size, which leaves the gaps unallocated.
+
+    >>> copy_file("big.iso", "backup/big.iso")
+    CopyResult(src='big.iso', dst='backup/big.iso', bytes=4700000000,
+               seconds=1.9, method='copy_file_range')
+    >>> report = copy_many(pairs, max_workers=8)
+    >>> print(f"{report.bytes_per_second / 1e9:.2f} GB/s")
+
+copy_many() runs copies on a bounded thread pool. Every method spends its
+time in system calls that release the GIL, so the copies run in parallel.
+Only file contents are copied, as with shutil.copyfile. Use
+shutil.copystat for permissions and timestamps.
+"""
+
+import errno
+import os
+import shutil
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # 1 MiB, for the readinto fallback
+# sendfile() and copy_file_range() move at most about 2 GiB per call.
+_MAX_CHUNK = 1 << 30
+# Errors meaning "not possible for these files", not "the copy failed".
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                errno.ENOTSUP, errno.EBADF, errno.ENOTSOCK, errno.EPERM}
+
+
+class CopyResult(namedtuple("CopyResult", "src dst bytes seconds method")):
+    """One copy; bytes counts data copied, not holes skipped"""
+
+    __slots__ = ()
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+class CopyReport(namedtuple("CopyReport", "results bytes seconds")):
+    """A batch of copies; seconds is the wall time of the whole batch"""
+
+    __slots__ = ()
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+# ============================================================================
+# COPY METHODS
+# ============================================================================
+# Each copies count bytes from offset in src to the same offset in dst and
+# returns (bytes copied, finished). finished is False when the method is
+# unsupported, so the next method continues from offset + copied.
+
+def _copy_file_range(src, dst, offset, count, buffer):
+    copied = 0
+    while copied < count:
+        try:
+            n = os.copy_file_range(src.fileno(), dst.fileno(),
+                                   min(count - copied, _MAX_CHUNK),
+                                   offset + copied, offset + copied)
+        except OSError as e:
+            if e.errno in _UNSUPPORTED:
+                return copied, False
+            raise
+        if not n:
+            # End of file, or a filesystem (procfs, sysfs) that reports no
+            # data here; a plain read tells the two apart.
+            return copied, False
+        copied += n
+    return copied, True
+
+
+def _sendfile(src, dst, offset, count, buffer):
+    copied = 0
+    # sendfile writes at the destination's file position.
+    os.lseek(dst.fileno(), offset, os.SEEK_SET)
+    while copied < count:
+        try:
+            n = os.sendfile(dst.fileno(), src.fileno(), offset + copied,
+                            min(count - copied, _MAX_CHUNK))
+        except OSError as e:
+            if e.errno in _UNSUPPORTED:
+                return copied, False
+            raise
+        if not n:
+            return copied, False
+        copied += n
+    return copied, True
+
+
+def _readinto(src, dst, offset, count, buffer):
+    copied = 0
+    view = memoryview(buffer)
+    src.seek(offset)
+    dst.seek(offset)
+    while copied < count:
+        n = src.readinto(view[:min(len(view), count - copied)])
+        if not n:
+            break  # the source shrank while we copied
+        dst.write(view[:n])
+        copied += n
+    return copied, True
+
+
+METHODS = {
+    "copy_file_range": _copy_file_range,
+    "sendfile": _sendfile,
+    "readinto": _readinto,
+}
+DEFAULT_METHODS = tuple(name for name in METHODS
+                        if name == "readinto" or hasattr(os, name))
+
+
+def _data_regions(fd, size):
+    """(start, end) of each allocated region, or the whole file"""
+    offset = 0
+    while offset < size:
+        try:
+            start = os.lseek(fd, offset, os.SEEK_DATA)
+        except OSError as e:
+            if e.errno == errno.ENXIO:
+                return  # only a hole remains
+            if offset == 0 and e.errno in _UNSUPPORTED:
+                yield 0, size
+                return
+            raise
+        end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+        yield start, end
+        offset = end
+
+
+def _is_sparse(stat):
+    blocks = getattr(stat, "st_blocks", None)
+    return blocks is not None and blocks * 512 < stat.st_size
+
+
+def copy_file(src, dst, sparse=True, methods=DEFAULT_METHODS,
+              block_size=DEFAULT_BLOCK_SIZE):
+    """Copy the contents of src to dst; returns a CopyResult"""
+    unknown = set(methods) - set(METHODS)
+    if unknown or not methods:
+        raise ValueError(f"methods must be a non-empty subset of "
+                         f"{sorted(METHODS)}")
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    start = time.perf_counter()
+    pending = list(methods)
+    used = []
+    buffer = None
+    copied = 0
+    with open(src, "rb", buffering=0) as fsrc, \
+            open(dst, "wb", buffering=0) as fdst:
+        stat = os.fstat(fsrc.fileno())
+        size = stat.st_size
+        if not size:
+            # Pipes and procfs files report no size: read until EOF.
+            regions = [(0, sys.maxsize)]
+            pending = ["readinto"]
+        elif sparse and hasattr(os, "SEEK_DATA") and _is_sparse(stat):
+            regions = list(_data_regions(fsrc.fileno(), size))
+        else:
+            regions = [(0, size)]
+        final_size = size
+        for region_start, region_end in regions:
+            offset = region_start
+            while offset < region_end:
+                name = pending[0]
+                if name == "readinto" and buffer is None:
+                    buffer = bytearray(block_size)
+                n, finished = METHODS[name](fsrc, fdst, offset,
+                                            region_end - offset, buffer)
+                if n and name not in used:
+                    used.append(name)
+                offset += n
+                copied += n
+                if finished:
+                    break
+                if len(pending) == 1:
+                    raise OSError(
+                        errno.ENOTSUP,
+                        f"no copy method in {tuple(methods)} could copy "
+                        f"{src!r} to {dst!r} past offset {offset}")
+                pending.pop(0)
+            if offset < region_end:
+                # Only readinto() finishes early: it hit EOF because the
+                # source shrank while we copied.
+                final_size = offset
+                break
+        # Sets the final size, leaving any trailing hole unallocated.
+        os.ftruncate(fdst.fileno(), final_size)
+    return CopyResult(os.fspath(src), os.fspath(dst), copied,
+                      time.perf_counter() - start, "+".join(used) or "none")
+
+
+def copy_many(pairs, max_workers=4, **options):
+    """
+    Copy every (src, dst) pair on a thread pool of at most max_workers
+    threads. Returns a CopyReport; the first error is raised.
+    """
+    pairs = list(pairs)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max(1, max_workers)) as pool:
+        results = list(pool.map(lambda pair: copy_file(*pair, **options),
+                                pairs))
+    return CopyReport(results, sum(r.bytes for r in results),
+                      time.perf_counter() - start)
@@ -0,0 +1,70 @@
+"""
+Line Counting
+=============
+Counts lines in constant memory, for one file or many at once.
+
+`process_file` in python_core.exception_handling counts lines with
+`len(f.readlines())`, which decodes the file and keeps every line in a
+list until the count is known. count_lines() reads fixed-size blocks
+into a buffer that is reused for the whole file and counts b"\\n" in C:
+
+    >>> count_lines("app.log")
+    3680000
+    >>> count_lines_many(glob.glob("logs/*.log"))     # {path: count}
+
+count_lines_many() runs one count per file on a thread pool. readinto()
+releases the GIL while it waits for the disk, so threads overlap I/O on
+cold caches and network filesystems. The count itself holds the GIL, so
+files already in the page cache gain little from more threads. Each
+thread reuses one buffer, so peak memory is max_workers * block_size
+however large the files are.
+
+Counts match len(f.readlines()) for files with \\n or \\r\\n line endings:
+a final line without a newline counts as a line. Files that use a bare
+\\r as the line separator count as a single line.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+_local = threading.local()
+
+
+def _buffer(block_size):
+    """This thread's reusable read buffer"""
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None or len(buffer) != block_size:
+        buffer = _local.buffer = bytearray(block_size)
+    return buffer
+
+
+def count_lines(path, block_size=DEFAULT_BLOCK_SIZE):
+    """Number of lines in a file, like len(f.readlines())"""
+    buffer = _buffer(block_size)
+    count = 0
+    last = 10  # b"\n", so an empty file has no unterminated last line
+    # Unbuffered, so readinto() fills our buffer directly with no extra copy.
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            count += buffer.count(b"\n", 0, n)
+            last = buffer[n - 1]
+    return count + (last != 10)
+
+
+def count_lines_many(paths, max_workers=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    {path: line count} for every path, counted on a thread pool.
+    The first error (FileNotFoundError, PermissionError...) is raised.
+    """
+    paths = list(paths)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max(1, min(max_workers, len(paths) or 1))) as pool:
+        counts = pool.map(lambda path: count_lines(path, block_size), paths)
+        return dict(zip(paths, counts))
@@ -0,0 +1,233 @@
+"""
+Line Offset Index
+=================
+Random access to line N of a large text file without rescanning it.
+
+`for line_num, line in enumerate(f, 1)` in python_core.file_handling and
+`process_file` in python_core.exception_handling read from the start
+every time. LineIndex records the byte offset where each line starts in
+a sidecar file next to the data. Reading line N is then one seek and one
+read:
+
+    with LineIndex("huge.log") as index:     # builds or loads huge.log.idx
+        print(len(index))                    # number of lines
+        print(index.get_line(1_000_000))     # bytes, without the newline
+        for line in index.get_lines(10, 20, encoding="utf-8"):
+            ...
+
+The sidecar is a short header followed by the offsets as raw array('Q')
+data, 8 bytes per line. When the data file grows, only the appended bytes
+are scanned and their offsets are appended to the sidecar. To detect a
+rewrite rather than an append, the header keeps a digest of the last
+FINGERPRINT_BYTES that were indexed. A file that shrank or whose digest
+no longer matches is indexed again from the start. An edit in the middle
+of the file that leaves the size and the tail unchanged goes unnoticed;
+call rebuild() after such an edit.
+
+Line numbers start at 0, like list indexes. Lines are split on b"\\n".
+"""
+
+import hashlib
+import os
+import struct
+from array import array
+from itertools import accumulate, islice
+
+FINGERPRINT_BYTES = 4096
+SCAN_BLOCK_SIZE = 1 << 22  # 4 MiB
+SUFFIX = ".idx"
+
+_MAGIC = b"LIDX"
+_VERSION = 1
+# magic, version, indexed size, line count, BLAKE2b-128 of the indexed tail
+_HEADER = struct.Struct("<4sIQQ16s")
+
+
+def _line_starts(f, start, stop, previous_byte):
+    """
+    Offsets in [start, stop) where a line begins, reading f from start.
+    previous_byte is the byte just before start, or None at offset 0.
+    """
+    starts = array("Q")
+    if start < stop and previous_byte in (None, b"\n"):
+        starts.append(start)
+    f.seek(start)
+    base = start
+    while base < stop:
+        block = f.read(min(SCAN_BLOCK_SIZE, stop - base))
+        if not block:
+            break
+        # Offsets after each newline, computed in C: running sums of the
+        # piece lengths plus one for every newline.
+        pieces = block.split(b"\n")
+        pieces.pop()
+        starts.extend(islice(accumulate(map((1).__add__, map(len, pieces)),
+                                        initial=base), 1, None))
+        base += len(block)
+    if starts and starts[-1] == stop:
+        starts.pop()  # a newline at the very end starts no line yet
+    return starts
+
+
+class LineIndex:
+    """Persistent index of line start offsets for one file"""
+
+    def __init__(self, path, index_path=None, autosave=True):
+        self.path = os.fspath(path)
+        self.index_path = (os.fspath(index_path) if index_path is not None
+                           else self.path + SUFFIX)
+        self.autosave = autosave
+        self.offsets = array("Q")
+        self.size = 0
+        self._fingerprint = b""
+        self._file = open(self.path, "rb", buffering=0)
+        self._load()
+        self.refresh()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    # ------------------------------------------------------------------
+    # Building and persisting
+    # ------------------------------------------------------------------
+
+    def _tail_digest(self, size):
+        start = max(0, size - FINGERPRINT_BYTES)
+        self._file.seek(start)
+        tail = self._file.read(size - start)
+        return hashlib.blake2b(tail, digest_size=16).digest()
+
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                magic, version, size, count, fingerprint = \
+                    _HEADER.unpack(header)
+                if magic != _MAGIC or version != _VERSION:
+                    return
+                offsets = array("Q")
+                offsets.fromfile(f, count)
+        except (OSError, EOFError):
+            return  # missing or truncated: index from scratch
+        self.offsets, self.size, self._fingerprint = offsets, size, fingerprint
+
+    def _write_header(self, f):
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, self.size, len(self.offsets),
+                             self._fingerprint))
+
+    def save(self):
+        """Write the whole sidecar file"""
+        temp = self.index_path + ".tmp"
+        with open(temp, "wb") as f:
+            self._write_header(f)
+            self.offsets.tofile(f)
+        os.replace(temp, self.index_path)
+
+    def _save_appended(self, old_count):
+        """Append new offsets to the sidecar, then update its header"""
+        try:
+            f = open(self.index_path, "r+b")
+        except FileNotFoundError:
+            return self.save()
+        with f:
+            # The header is written last, so a crash in between leaves a
+            # valid sidecar that simply ignores the extra offsets.
+            f.seek(_HEADER.size + 8 * old_count)
+            f.truncate()
+            self.offsets[old_count:].tofile(f)
+            f.flush()
+            self._write_header(f)
+
+    def rebuild(self):
+        """Index the whole file again"""
+        self.offsets = array("Q")
+        self.size = 0
+        self._fingerprint = b""
+        self._extend(os.fstat(self._file.fileno()).st_size)
+        if self.autosave:
+            self.save()
+
+    def refresh(self):
+        """Index bytes appended since the last call; returns lines added"""
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.size or (self._fingerprint and
+                                self._tail_digest(self.size) != self._fingerprint):
+            # Shrunk, or rewritten in place: the old offsets are stale.
+            self.rebuild()
+            return len(self.offsets)
+        if size == self.size and self._fingerprint:
+            return 0
+        old_count = len(self.offsets)
+        # A last line without a newline may continue in the appended bytes.
+        self._extend(size)
+        if self.autosave:
+            if old_count:
+                self._save_appended(old_count)
+            else:
+                self.save()
+        return len(self.offsets) - old_count
+
+    def _extend(self, size):
+        previous = None
+        if self.size:
+            self._file.seek(self.size - 1)
+            previous = self._file.read(1)
+        self.offsets.extend(_line_starts(self._file, self.size, size,
+                                         previous))
+        self.size = size
+        self._fingerprint = self._tail_digest(size)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _span(self, n):
+        """(start, end) of line n, end excluding its newline"""
+        if n < 0:
+            n += len(self.offsets)
+        if not 0 <= n < len(self.offsets):
+            raise IndexError("line index out of range")
+        start = self.offsets[n]
+        end = (self.offsets[n + 1] - 1 if n + 1 < len(self.offsets)
+               else self.size)
+        return start, end
+
+    def get_line(self, n, encoding=None):
+        """Line n as bytes, or str when an encoding is given"""
+        if n >= len(self.offsets):
+            self.refresh()
+        start, end = self._span(n)
+        self._file.seek(start)
+        line = self._file.read(end - start)
+        if line.endswith(b"\n"):
+            line = line[:-1]  # the final line of the indexed region
+        return line.decode(encoding) if encoding else line
+
+    def get_lines(self, a, b, encoding=None):
+        """Lines a to b-1 with one seek and one read"""
+        if b > len(self.offsets):
+            self.refresh()
+        a, b, _ = slice(a, b).indices(len(self.offsets))
+        if a >= b:
+            return []
+        start, end = self.offsets[a], self._span(b - 1)[1]
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        if end == self.size and data.endswith(b"\n"):
+            data = data[:-1]
+        lines = data.split(b"\n")
+        if encoding:
+            return [line.decode(encoding) for line in lines]
+        return lines
@@ -0,0 +1,166 @@
+"""
+Memory-Mapped Line Scanning
+===========================
+Reads lines from files of any size without decoding or copying them.
+
+The idioms in python_core.file_handling decode every line into a new
+str, and `readlines()` keeps all of them in memory at once. LineScanner
+maps the file with mmap and hands out memoryview slices of the mapping
+instead. The page cache supplies the bytes, and only the lines you decode
+are converted:
+
+    with LineScanner("huge.log") as scanner:
+        for line in scanner.lines():             # memoryview, no copy
+            if line[:5] == b"ERROR":
+                print(decode(line))
+
+For work that can be done a block at a time, blocks() yields large slices
+that always end on a line boundary. Searching them with a bytes regex or
+counting with count() stays in C, without any per-line Python overhead:
+
+    with LineScanner("huge.log") as scanner:
+        for block in scanner.blocks():
+            for match in re.finditer(rb"^ERROR.*$", block, re.MULTILINE):
+                ...
+
+lines() pays a few Python operations per line, so it is slower than
+`for line in f` over a binary file; it saves the str allocation and
+decoding, not CPU time. Use blocks() for throughput (see
+benchmarks/bench_linescan.py).
+
+Lines are split on b"\\n" only. A trailing b"\\r" from Windows line endings
+is kept unless strip_cr=True.
+
+Slices stay valid after close(). The mapping is released once the
+scanner and every slice handed out are gone. Call bytes(view) on a line to
+keep an independent copy.
+"""
+
+import mmap
+import os
+
+DEFAULT_BLOCK_SIZE = 1 << 24  # 16 MiB
+
+
+def decode(line, encoding="utf-8", errors="strict"):
+    """str of a line slice, decoded on demand"""
+    return str(line, encoding, errors)
+
+
+class LineScanner:
+    """Read-only memory map of a file with line-oriented iteration"""
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.closed = False
+        with open(self.path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # mmap cannot map an empty file; an empty view behaves the same.
+            if self.size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._map, "madvise"):
+                    self._map.madvise(mmap.MADV_SEQUENTIAL)
+                self._view = memoryview(self._map)
+            else:
+                self._map = None
+                self._view = memoryview(b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap now if no slices are alive, otherwise when they are freed"""
+        self.closed = True
+        view, mapped = self._view, self._map
+        self._view = memoryview(b"")
+        self._map = None
+        view.release()
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # Slices handed out still export the buffer; each holds a
+                # reference to the map, which is unmapped with the last one.
+                pass
+
+    def _check_open(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed LineScanner")
+
+    def _boundaries(self, block_size):
+        """(start, end) of blocks of whole lines, end exclusive"""
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self._check_open()
+        mapped, size = self._map, self.size
+        start = 0
+        while start < size:
+            end = min(start + block_size, size)
+            if end < size:
+                cut = mapped.rfind(b"\n", start, end)
+                if cut < 0:
+                    # A single line longer than the block: extend to its end.
+                    cut = mapped.find(b"\n", end)
+                    end = size if cut < 0 else cut + 1
+                else:
+                    end = cut + 1
+            yield start, end
+            start = end
+
+    def blocks(self, block_size=DEFAULT_BLOCK_SIZE):
+        """Zero-copy memoryview blocks that end on a line boundary"""
+        view = self._view
+        for start, end in self._boundaries(block_size):
+            yield view[start:end]
+
+    def lines(self, keepends=False, strip_cr=False):
+        """Zero-copy memoryview of each line"""
+        self._check_open()
+        if not self.size:
+            return
+        find, view, size = self._map.find, self._view, self.size
+        tail = 1 if keepends else 0
+        start = 0
+        while True:
+            end = find(b"\n", start)
+            if end < 0:
+                break
+            if strip_cr and not keepends and end > start \
+                    and view[end - 1] == 13:
+                yield view[start:end - 1]
+            else:
+                yield view[start:end + tail]
+            start = end + 1
+        if start < size:
+            end = size
+            if strip_cr and not keepends and view[end - 1] == 13:
+                end -= 1
+            yield view[start:end]
+
+    def count(self, needle=b"\n"):
+        """
+        Occurrences of a single-line needle, counted a block at a time.
+        Each block is copied once into a bytes object for bytes.count, so
+        memory stays at one block however large the file is.
+        """
+        self._check_open()
+        total = 0
+        for start, end in self._boundaries(DEFAULT_BLOCK_SIZE):
+            total += self._map[start:end].count(needle)
+        return total
+
+    def line_count(self):
+        """Number of lines, counting a final line without a newline"""
+        self._check_open()
+        if not self.size:
+            return 0
+        return self.count() + (self._map[self.size - 1] != 10)
+
+
+def scan_lines(path, keepends=False, strip_cr=False):
+    """Yield memoryview lines of path; the map closes when exhausted"""
+    with LineScanner(path) as scanner:
+        yield from scanner.lines(keepends, strip_cr)
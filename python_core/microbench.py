@@ -0,0 +1,258 @@
+"""
+Micro-Benchmarks
+================
+A small timeit-style harness that produces results you can compare between
+runs:
+
+    suite = Suite()
+
+    @suite.bench("counting", "dict.get")
+    def count_get(words=WORDS):
+        counts = {}
+        for w in words:
+            counts[w] = counts.get(w, 0) + 1
+
+    results = suite.run()                 # calibrate, warm up, sample
+    save(results, "baseline.json")
+    ...
+    for row in compare(load("baseline.json"), results):
+        print(row)
+
+Each benchmark goes through these steps:
+
+1. Calibration: double the loop count until one sample takes at least
+   `min_time` seconds, so clock resolution and loop overhead stay small.
+2. Warmup: run `warmup` samples and throw them away.
+3. Sampling: time `repeat` samples. Samples outside Tukey's fences
+   (1.5 IQR beyond the quartiles) are rejected as outliers, for example
+   from the scheduler. The garbage collector is off while sampling, as in
+   timeit.
+
+Results are plain JSON with a schema version and machine details. compare()
+runs a two-sided Mann-Whitney U test on the per-loop samples. A benchmark is
+flagged only if p < alpha and the median moved by more than `threshold`, so
+noise is not flagged on the first count and negligible changes are not
+flagged on the second.
+"""
+
+import datetime
+import fnmatch
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+SCHEMA_VERSION = 1
+
+
+class Benchmark:
+    """A named zero-argument callable"""
+
+    __slots__ = ("group", "name", "func")
+
+    def __init__(self, group, name, func):
+        self.group = group
+        self.name = name
+        self.func = func
+
+    @property
+    def key(self):
+        return f"{self.group}/{self.name}"
+
+
+def _time_loops(func, loops, clock=time.perf_counter_ns):
+    """Nanoseconds for `loops` calls of func"""
+    iterations = range(loops)
+    start = clock()
+    for _ in iterations:
+        func()
+    return clock() - start
+
+
+def calibrate(func, min_time=0.01, max_loops=1 << 24):
+    """Smallest power-of-two loop count whose sample takes min_time"""
+    loops = 1
+    target = min_time * 1e9
+    while loops < max_loops:
+        if _time_loops(func, loops) >= target:
+            break
+        loops *= 2
+    return loops
+
+
+def reject_outliers(samples):
+    """(kept, rejected) using Tukey's fences at 1.5 IQR"""
+    if len(samples) < 4:
+        return list(samples), []
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    spread = 1.5 * (q3 - q1)
+    lo, hi = q1 - spread, q3 + spread
+    kept = [s for s in samples if lo <= s <= hi]
+    rejected = [s for s in samples if not lo <= s <= hi]
+    return kept, rejected
+
+
+def measure(func, repeat=20, warmup=3, min_time=0.01):
+    """Calibrate, warm up and sample func; returns a result dict"""
+    loops = calibrate(func, min_time)
+    for _ in range(warmup):
+        _time_loops(func, loops)
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    samples = []
+    try:
+        for _ in range(repeat):
+            samples.append(_time_loops(func, loops) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    kept, rejected = reject_outliers(samples)
+    return {
+        "loops": loops,
+        "samples_ns": kept,
+        "rejected_ns": rejected,
+        "median_ns": statistics.median(kept),
+        "mean_ns": statistics.fmean(kept),
+        "stdev_ns": statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        "min_ns": min(kept),
+    }
+
+
+class Suite:
+    """A registry of benchmarks run together"""
+
+    def __init__(self):
+        self.benchmarks = []
+
+    def bench(self, group, name=None):
+        """Decorator registering a zero-argument function"""
+        def decorator(func):
+            self.add(group, name or func.__name__, func)
+            return func
+        return decorator
+
+    def add(self, group, name, func):
+        benchmark = Benchmark(group, name, func)
+        if any(b.key == benchmark.key for b in self.benchmarks):
+            raise ValueError(f"duplicate benchmark {benchmark.key!r}")
+        self.benchmarks.append(benchmark)
+        return benchmark
+
+    def select(self, patterns=None):
+        if not patterns:
+            return list(self.benchmarks)
+        return [b for b in self.benchmarks
+                if any(fnmatch.fnmatch(b.key, p) for p in patterns)]
+
+    def run(self, patterns=None, repeat=20, warmup=3, min_time=0.01,
+            progress=None):
+        """Measure the selected benchmarks; returns a results document"""
+        results = {}
+        for benchmark in self.select(patterns):
+            results[benchmark.key] = measure(benchmark.func, repeat, warmup,
+                                             min_time)
+            if progress is not None:
+                progress(benchmark.key, results[benchmark.key])
+        return {
+            "schema": SCHEMA_VERSION,
+            "created": datetime.datetime.now(datetime.timezone.utc)
+                       .isoformat(timespec="seconds"),
+            "environment": environment(),
+            "settings": {"repeat": repeat, "warmup": warmup,
+                         "min_time": min_time},
+            "results": results,
+        }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "executable": sys.executable,
+    }
+
+
+def save(document, path):
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported schema "
+                         f"{document.get('schema')!r}, "
+                         f"expected {SCHEMA_VERSION}")
+    return document
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+def mann_whitney_u(a, b):
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation
+    with tie correction), stdlib only"""
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(pooled)
+    ties = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    r1 = sum(r for r, (_, group) in zip(ranks, pooled) if group == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    var = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+    z = (abs(u1 - mean) - 0.5) / math.sqrt(var)
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def compare(old, new, alpha=0.01, threshold=0.05):
+    """
+    One row per benchmark present in both documents:
+    (key, old median ns, new median ns, relative change, p-value, verdict)
+    with verdict "regression", "improvement" or "same".
+    """
+    rows = []
+    for key, before in old["results"].items():
+        after = new["results"].get(key)
+        if after is None:
+            continue
+        change = after["median_ns"] / before["median_ns"] - 1
+        p = mann_whitney_u(before["samples_ns"], after["samples_ns"])
+        verdict = "same"
+        if p < alpha and abs(change) > threshold:
+            verdict = "regression" if change > 0 else "improvement"
+        rows.append((key, before["median_ns"], after["median_ns"], change, p,
+                     verdict))
+    return rows
+
+
+def format_ns(ns):
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.1f} ns"
@@ -0,0 +1,162 @@
+"""
+Output Sinks
+============
+The example scripts write hundreds of short lines with print(). When stdout
+is a terminal, each line is its own write system call. `install_output()`
+swaps sys.stdout for a sink, so every print (including those in modules the
+scripts generate and import) goes through it unchanged:
+
+    from python_core.output import install_output
+    install_output()               # mode from $PYTHON_CORE_OUTPUT
+
+Modes:
+
+- "buffered" (default) - collect writes and pass them on in 64 KiB batches,
+  at exit, and before anything is written to stderr
+- "null"     - discard everything, for timing the code without its output
+- "capture"  - keep everything in memory; read it with sink.getvalue()
+- "direct"   - leave sys.stdout alone
+
+"capture" is only accepted as an argument, since the caller must keep the
+returned sink to read it; $PYTHON_CORE_OUTPUT=capture raises ValueError.
+
+For a harness that wants a script's text, `capture()` redirects stdout for
+the duration of a with-block:
+
+    with capture() as out:
+        python_core.functions.main()
+    text = out.getvalue()
+"""
+
+import atexit
+import io
+import os
+import sys
+from contextlib import contextmanager
+
+DEFAULT_LIMIT = 64 * 1024
+MODES = ("buffered", "null", "capture", "direct")
+
+
+class BufferedSink(io.TextIOBase):
+    """Text stream that batches writes to an underlying stream"""
+
+    def __init__(self, stream, limit=DEFAULT_LIMIT):
+        self.stream = stream
+        self.limit = limit
+        self._parts = []
+        self._size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.limit:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self._parts:
+            text = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            self.stream.write(text)
+        self.stream.flush()
+
+    def isatty(self):
+        return self.stream.isatty()
+
+    @property
+    def encoding(self):
+        return getattr(self.stream, "encoding", "utf-8")
+
+
+class CaptureSink(BufferedSink):
+    """Keeps all output in memory"""
+
+    def __init__(self):
+        super().__init__(None, limit=float("inf"))
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+    def getvalue(self):
+        return "".join(self._parts)
+
+
+class NullSink(io.TextIOBase):
+    """Discards all output"""
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+
+class _FlushFirst:
+    """Wraps stderr so buffered stdout text is written before it"""
+
+    def __init__(self, stream, sink):
+        self._stream = stream
+        self._sink = sink
+
+    def write(self, text):
+        self._sink.flush()
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def make_sink(mode, stream=None):
+    if mode == "buffered":
+        return BufferedSink(stream if stream is not None else sys.stdout)
+    if mode == "null":
+        return NullSink()
+    if mode == "capture":
+        return CaptureSink()
+    raise ValueError(f"mode must be one of {MODES}, not {mode!r}")
+
+
+def install_output(mode=None):
+    """
+    Route sys.stdout through a sink for the rest of the process.
+
+    Returns the sink, or sys.stdout unchanged for mode "direct". Calling it
+    again returns the sink already installed.
+    """
+    if not mode:
+        mode = os.environ.get("PYTHON_CORE_OUTPUT") or "buffered"
+        if mode == "capture":
+            # Nothing could ever read the sink: the text would be lost.
+            raise ValueError("PYTHON_CORE_OUTPUT=capture would discard all "
+                             "output; use install_output('capture') or the "
+                             "capture() context manager")
+    if isinstance(sys.stdout, (BufferedSink, NullSink)):
+        return sys.stdout
+    if mode == "direct":
+        return sys.stdout
+    sink = make_sink(mode)
+    sys.stdout = sink
+    if mode == "buffered":
+        # Keep warnings, logging and tracebacks in order with stdout.
+        sys.stderr = _FlushFirst(sys.stderr, sink)
+        atexit.register(sink.flush)
+    return sink
+
+
+@contextmanager
+def capture():
+    """Collect everything printed inside the block"""
+    sink = CaptureSink()
+    previous, sys.stdout = sys.stdout, sink
+    try:
+        yield sink
+    finally:
+        sys.stdout = previous
@@ -0,0 +1,222 @@
+"""
+Parallel Higher-Order Functions
+===============================
+`pmap`, `pfilter` and `preduce`: multi-core counterparts of the built-in
+`map`, `filter` and `functools.reduce` used in python_core.functions.
+
+    >>> list(pmap(lambda x: x * 2, [1, 2, 3, 4, 5]))
+    [2, 4, 6, 8, 10]
+    >>> preduce(lambda x, y: x * y, [1, 2, 3, 4, 5])
+    120
+
+Work is sent to the pool in chunks, so one task covers many items.
+Chunk size is picked from the input length when it is known. At most a
+few chunks per worker are in flight at once, so infinite or very large
+iterables stream through in bounded memory.
+
+For process pools the function reaches the workers through fork, not
+pickle, so lambdas and closures work as they do with the built-ins. On
+platforms without fork the function must be picklable.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from functools import partial, reduce
+from itertools import islice
+
+# Chunks in flight per worker: enough to hide scheduling latency.
+_PREFETCH = 4
+# Chunk size for iterables whose length is unknown.
+DEFAULT_CHUNKSIZE = 256
+
+_MISSING = object()
+_installed_func = None
+
+
+# ============================================================================
+# CHUNK TASKS (run inside the pool)
+# ============================================================================
+
+def _install(func):
+    global _installed_func
+    _installed_func = func
+
+
+def _map_chunk(func, chunk):
+    return [func(x) for x in chunk]
+
+
+def _filter_chunk(func, chunk):
+    return [x for x in chunk if func(x)]
+
+
+def _reduce_chunk(func, chunk):
+    return reduce(func, chunk)
+
+
+def _installed(task, chunk):
+    return task(_installed_func, chunk)
+
+
+# ============================================================================
+# POOL PLUMBING
+# ============================================================================
+
+def _fork_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+class _Pool:
+    """An executor plus the callable that runs one chunk on it"""
+
+    def __init__(self, task, func, executor, workers):
+        self.owned = not isinstance(executor, Executor)
+        if not self.owned:
+            self.executor = executor
+            self.workers = (workers or getattr(executor, "_max_workers", None)
+                            or os.cpu_count() or 1)
+            self.run = partial(task, func)
+            return
+
+        self.workers = workers or os.cpu_count() or 1
+        if executor == "thread":
+            self.executor = ThreadPoolExecutor(self.workers)
+            self.run = partial(task, func)
+        elif executor == "process":
+            context = _fork_context()
+            if context is not None:
+                self.executor = ProcessPoolExecutor(
+                    self.workers, mp_context=context,
+                    initializer=_install, initargs=(func,))
+                self.run = partial(_installed, task)
+            else:
+                self.executor = ProcessPoolExecutor(self.workers)
+                self.run = partial(task, func)
+        else:
+            raise ValueError(
+                f"executor must be 'thread', 'process' or an Executor, "
+                f"not {executor!r}")
+
+    def close(self):
+        if self.owned:
+            self.executor.shutdown(cancel_futures=True)
+
+
+def _auto_chunksize(iterable, workers):
+    try:
+        n = len(iterable)
+    except TypeError:
+        return DEFAULT_CHUNKSIZE
+    return max(1, -(-n // (workers * _PREFETCH)))
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_chunks(task, func, iterable, executor, workers, chunksize, ordered):
+    """Yield the result of task(func, chunk) for every chunk of iterable"""
+    pool = _Pool(task, func, executor, workers)
+    try:
+        if chunksize is None:
+            chunksize = _auto_chunksize(iterable, pool.workers)
+        elif chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        limit = pool.workers * _PREFETCH
+        submit = partial(pool.executor.submit, pool.run)
+
+        if ordered:
+            pending = deque()
+            for chunk in _chunks(iterable, chunksize):
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
+                pending.append(submit(chunk))
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            for chunk in _chunks(iterable, chunksize):
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(submit(chunk))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    finally:
+        pool.close()
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def pmap(func, iterable, *, executor="process", workers=None, chunksize=None,
+         ordered=True):
+    """
+    Parallel map(func, iterable).
+
+    Args:
+        func: Function of one argument
+        iterable: Items to map over (consumed lazily)
+        executor: "process", "thread", or an existing concurrent.futures
+            Executor (which is left running afterwards)
+        workers: Pool size (default: number of CPUs)
+        chunksize: Items per task (default: chosen from len(iterable))
+        ordered: Yield results in input order; if False, yield each chunk's
+            results as soon as it finishes
+
+    Yields:
+        func(item) for each item
+    """
+    for block in _run_chunks(_map_chunk, func, iterable, executor, workers,
+                             chunksize, ordered):
+        yield from block
+
+
+def pfilter(predicate, iterable, *, executor="process", workers=None,
+            chunksize=None, ordered=True):
+    """Parallel filter(predicate, iterable); arguments as for pmap"""
+    for block in _run_chunks(_filter_chunk, predicate, iterable, executor,
+                             workers, chunksize, ordered):
+        yield from block
+
+
+def _tree_combine(func, values):
+    """Reduce values pairwise in order, keeping the combine tree balanced"""
+    while len(values) > 1:
+        paired = [func(a, b) for a, b in zip(values[::2], values[1::2])]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def preduce(func, iterable, initial=_MISSING, *, executor="process",
+            workers=None, chunksize=None):
+    """
+    Parallel functools.reduce for an associative func.
+
+    Each chunk is reduced inside the pool, then the partial results are
+    combined in a balanced tree that keeps their input order. func must be
+    associative, but it need not be commutative.
+    """
+    partials = list(_run_chunks(_reduce_chunk, func, iterable, executor,
+                                workers, chunksize, ordered=True))
+    if initial is not _MISSING:
+        partials.insert(0, initial)
+    if not partials:
+        raise TypeError("preduce() of empty iterable with no initial value")
+    return _tree_combine(func, partials)
@@ -0,0 +1,379 @@
+"""
+Staged Pipelines
+================
+Run a chain of generator stages concurrently, each in its own thread or
+process, connected by bounded queues.
+
+Stages keep the style of the `numbers -> square -> filter_even` pipeline in
+python_core.advanced_topics. Each stage is a generator function that
+consumes an iterable and yields results:
+
+    def square(gen):
+        for num in gen:
+            yield num ** 2
+
+    def filter_even(gen):
+        for num in gen:
+            if num % 2 == 0:
+                yield num
+
+    pipe = Pipeline(range(10), Stage(square, mode="process"), filter_even)
+    print(list(pipe))        # [0, 4, 16, 36, 64]
+    print(pipe.report())     # per-stage throughput and queue occupancy
+
+Items travel between stages in batches of up to `batch_size`, so a queue
+hop costs one lock round-trip (or one pickle, between processes) per batch
+rather than per item. A stage flushes a partial batch whenever its own input
+runs dry or the batch has waited more than 10 ms, so slow sources do not
+stall the pipeline. Queues hold at most `maxsize` batches. A fast stage
+blocks on put until its consumer catches up (backpressure).
+
+An exception in any stage cancels the other stages and is re-raised in the
+consumer. Closing the result iterator early also cancels everything. A
+stage that exits (sys.exit(), KeyboardInterrupt) re-raises that in the
+consumer, and a process stage that dies without raising (a signal,
+os._exit(), the OOM killer) raises RuntimeError there instead of hanging
+it.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+
+# How often blocked gets and puts wake up to check for cancellation.
+_POLL_SECONDS = 0.05
+# Longest a partial batch is held back waiting for more items.
+_MAX_BATCH_DELAY = 0.01
+# How long shutdown waits for stages to report their stats and exit.
+_SHUTDOWN_SECONDS = 5.0
+
+
+class _End:
+    """Marks the end of a stage's output"""
+
+
+class _Failure:
+    """Carries a stage's exception downstream to the consumer"""
+
+    def __init__(self, stage, exc):
+        self.stage = stage
+        self.exc = exc
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _UpstreamFailed(Exception):
+    def __init__(self, failure):
+        super().__init__(failure.stage)
+        self.failure = failure
+
+
+class Stage:
+    """A generator function plus where to run it"""
+
+    MODES = ("thread", "process")
+
+    def __init__(self, func, *, mode="thread", name=None):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, not {mode!r}")
+        self.func = func
+        self.mode = mode
+        self.name = name or getattr(func, "__name__", repr(func))
+
+    def __repr__(self):
+        return f"Stage({self.name}, mode={self.mode!r})"
+
+
+class StageStats:
+    """Counters for one stage, sent back when the stage finishes"""
+
+    __slots__ = ("name", "mode", "items_in", "items_out", "batches_out",
+                 "elapsed", "get_wait", "put_wait", "queue_samples",
+                 "queue_total", "queue_max", "capacity")
+
+    def __init__(self, name, mode, capacity):
+        self.name = name
+        self.mode = mode
+        self.capacity = capacity
+        self.items_in = self.items_out = self.batches_out = 0
+        self.elapsed = self.get_wait = self.put_wait = 0.0
+        self.queue_samples = self.queue_total = self.queue_max = 0
+
+    @property
+    def throughput(self):
+        """Items emitted per second of the stage's lifetime"""
+        return self.items_out / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def busy(self):
+        """Fraction of the stage's lifetime not spent blocked on a queue"""
+        if not self.elapsed:
+            return 0.0
+        return max(0.0, 1 - (self.get_wait + self.put_wait) / self.elapsed)
+
+    @property
+    def mean_occupancy(self):
+        """Average fill of the output queue, as a fraction of capacity"""
+        if not self.queue_samples:
+            return 0.0
+        return self.queue_total / self.queue_samples / self.capacity
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls.__new__(cls)
+        for name, value in data.items():
+            setattr(stats, name, value)
+        return stats
+
+
+def _get(q, cancel, stats, check=None):
+    """Blocking get that wakes up to honour cancel and to run check()"""
+    start = time.perf_counter()
+    try:
+        while True:
+            if cancel.is_set():
+                raise _Cancelled
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if check is not None:
+                    check()
+    finally:
+        stats.get_wait += time.perf_counter() - start
+
+
+def _put(q, item, cancel, stats):
+    start = time.perf_counter()
+    try:
+        while True:
+            if cancel.is_set():
+                raise _Cancelled
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                pass
+    finally:
+        stats.put_wait += time.perf_counter() - start
+    try:
+        size = q.qsize()
+    except NotImplementedError:     # multiprocessing queues on macOS
+        return
+    stats.queue_samples += 1
+    stats.queue_total += size
+    stats.queue_max = max(stats.queue_max, size)
+
+
+def _run_stage(index, name, mode, func, inq, outq, stats_q, cancel,
+               batch_size, capacity):
+    """
+    Body of every stage thread or process.
+
+    For the source feeder func is None and inq is the source iterable.
+    """
+    stats = StageStats(name, mode, capacity)
+    clock = time.perf_counter
+    start = last_flush = clock()
+    pending = []
+
+    def flush():
+        nonlocal pending, last_flush
+        last_flush = clock()
+        if pending:
+            batch, pending = pending, []
+            stats.items_out += len(batch)
+            stats.batches_out += 1
+            _put(outq, batch, cancel, stats)
+
+    def inputs():
+        while True:
+            if inq.empty():
+                flush()
+            batch = _get(inq, cancel, stats)
+            if isinstance(batch, _End):
+                return
+            if isinstance(batch, _Failure):
+                raise _UpstreamFailed(batch)
+            stats.items_in += len(batch)
+            yield from batch
+
+    try:
+        try:
+            items = inq if func is None else func(inputs())
+            for item in items:
+                pending.append(item)
+                if (len(pending) >= batch_size
+                        or clock() - last_flush > _MAX_BATCH_DELAY):
+                    flush()
+            flush()
+            _put(outq, _End(), cancel, stats)
+        except _Cancelled:
+            pass
+        except _UpstreamFailed as upstream:
+            _put(outq, upstream.failure, cancel, stats)
+        except BaseException as exc:
+            # Also SystemExit and KeyboardInterrupt: the stage is over
+            # either way, and its consumer must hear about it.
+            _put(outq, _Failure(name, exc), cancel, stats)
+    except _Cancelled:
+        pass
+    finally:
+        stats.elapsed = time.perf_counter() - start
+        if cancel.is_set() and hasattr(outq, "cancel_join_thread"):
+            # Don't let unread batches keep this process alive at exit.
+            outq.cancel_join_thread()
+        stats_q.put((index, stats.as_dict()))
+
+
+class Pipeline:
+    """
+    Source iterable followed by stages, run concurrently.
+
+    Args:
+        source: Any iterable; it is read by its own feeder thread
+        *stages: Stage objects, or bare generator functions (run as threads)
+        maxsize: Capacity of each inter-stage queue, in batches
+        batch_size: Items per batch handed between stages
+    """
+
+    def __init__(self, source, *stages, maxsize=8, batch_size=256):
+        if maxsize < 1 or batch_size < 1:
+            raise ValueError("maxsize and batch_size must be at least 1")
+        self.source = source
+        self.stages = [s if isinstance(s, Stage) else Stage(s) for s in stages]
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.stats = []
+        self._cancel = None
+
+    def _context(self):
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context()
+
+    def __iter__(self):
+        uses_processes = any(s.mode == "process" for s in self.stages)
+        ctx = self._context() if uses_processes else None
+        cancel = ctx.Event() if ctx else threading.Event()
+        stats_q = ctx.Queue() if ctx else queue.Queue()
+        self._cancel = cancel
+
+        # One queue per edge; multiprocessing queues only where a process
+        # stage sits on either side.
+        modes = ["thread"] + [s.mode for s in self.stages] + ["thread"]
+        queues = []
+        for left, right in zip(modes, modes[1:]):
+            if "process" in (left, right):
+                queues.append(ctx.Queue(self.maxsize))
+            else:
+                queues.append(queue.Queue(self.maxsize))
+
+        workers = []
+        feeder = threading.Thread(
+            target=_run_stage, daemon=True,
+            args=(0, "<source>", "thread", None, self.source, queues[0],
+                  stats_q, cancel, self.batch_size, self.maxsize))
+        workers.append(feeder)
+        for i, stage in enumerate(self.stages):
+            args = (i + 1, stage.name, stage.mode, stage.func, queues[i],
+                    queues[i + 1], stats_q, cancel, self.batch_size,
+                    self.maxsize)
+            if stage.mode == "process":
+                workers.append(ctx.Process(target=_run_stage, args=args,
+                                           daemon=True))
+            else:
+                workers.append(threading.Thread(target=_run_stage, args=args,
+                                                daemon=True))
+        for worker in workers:
+            worker.start()
+
+        names = ["<source>"] + [stage.name for stage in self.stages]
+        processes = [(i, worker) for i, worker in enumerate(workers)
+                     if isinstance(worker, multiprocessing.process.BaseProcess)]
+        collected = {}
+
+        def check_processes():
+            # A process killed by a signal, os._exit() or the OOM killer
+            # never sends _End or _Failure, so its consumer would wait
+            # forever. Every stage reports its stats after its last put,
+            # so a process that exited without reporting died early,
+            # whatever its exit code.
+            while True:
+                try:
+                    index, data = stats_q.get_nowait()
+                except queue.Empty:
+                    break
+                collected[index] = StageStats.from_dict(data)
+            for i, process in processes:
+                if process.exitcode is not None and i not in collected:
+                    raise RuntimeError(
+                        f"stage {names[i]!r} exited with code "
+                        f"{process.exitcode} before finishing")
+
+        consumer_stats = StageStats("<consumer>", "thread", self.maxsize)
+        failure = None
+        try:
+            while True:
+                batch = _get(queues[-1], cancel, consumer_stats,
+                             check_processes if processes else None)
+                if isinstance(batch, _End):
+                    break
+                if isinstance(batch, _Failure):
+                    failure = batch
+                    break
+                yield from batch
+        finally:
+            cancel.set()
+            deadline = time.monotonic() + _SHUTDOWN_SECONDS
+            while len(collected) < len(workers):
+                try:
+                    index, data = stats_q.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    # A dead stage never reports; stop once only those
+                    # remain, or when the others take too long.
+                    if (time.monotonic() > deadline or not any(
+                            worker.is_alive() for i, worker
+                            in enumerate(workers) if i not in collected)):
+                        break
+                    continue
+                collected[index] = StageStats.from_dict(data)
+            for q in queues:
+                if hasattr(q, "cancel_join_thread"):
+                    q.cancel_join_thread()
+            for worker in workers:
+                worker.join(max(0.0, deadline - time.monotonic()))
+                if (isinstance(worker, multiprocessing.process.BaseProcess)
+                        and worker.is_alive()):
+                    worker.terminate()
+                    worker.join()
+            self.stats = [collected.get(i) or StageStats(names[i], mode,
+                                                         self.maxsize)
+                          for i, mode in enumerate(modes[:-1])]
+        if failure is not None:
+            raise failure.exc
+
+    def cancel(self):
+        """Stop a running pipeline from another thread"""
+        if self._cancel is not None:
+            self._cancel.set()
+
+    def run(self):
+        """Run to completion and return all results as a list"""
+        return list(self)
+
+    def report(self):
+        """Table of per-stage throughput, busy time and queue occupancy"""
+        lines = [f"{'stage':<20} {'mode':<8} {'items out':>10} {'items/s':>12} "
+                 f"{'busy':>6} {'queue avg':>10} {'queue max':>10}"]
+        for s in self.stats:
+            lines.append(
+                f"{s.name:<20} {s.mode:<8} {s.items_out:>10} "
+                f"{s.throughput:>12,.0f} {s.busy:>6.0%} "
+                f"{s.mean_occupancy:>10.0%} {s.queue_max:>6}/{s.capacity:<3}")
+        return "\n".join(lines)
@@ -0,0 +1,224 @@
+"""
+Prime Engine
+============
+Segmented Sieve of Eratosthenes with optional multi-core fan-out, plus a
+deterministic Miller-Rabin test for single 64-bit queries.
+
+This replaces the trial-division `is_prime` from python_core.control_flow
+for bulk work:
+
+    >>> list(primes_between(10, 30))
+    [11, 13, 17, 19, 23, 29]
+    >>> is_prime(2**61 - 1)
+    True
+
+Segments only store odd candidates, one byte each, so crossing off the
+multiples of a prime is a single bytearray slice assignment that runs in C.
+Memory stays bounded by the segment size no matter how wide the range is.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
+
+# Integers covered by one segment (odd candidates only are stored, so the
+# working bytearray is half this size and fits comfortably in L2 cache).
+DEFAULT_SEGMENT_SIZE = 1 << 19
+
+# The first 13 primes as witnesses make Miller-Rabin exact for every
+# n < 3.317 * 10**24 (Sorenson and Webster); without 41 the bound is only
+# about 3.18 * 10**23. Either covers the whole unsigned 64-bit range.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Base primes shared with pool workers (set once by the initializer).
+_worker_base_primes = None
+
+
+# ============================================================================
+# SINGLE QUERIES
+# ============================================================================
+
+def is_prime(n):
+    """
+    Deterministic primality test for integers below 2**64.
+
+    Small factors are rejected by trial division; everything else goes
+    through Miller-Rabin with a fixed witness set, which is exact below
+    3.317 * 10**24. Larger inputs are still answered, but only
+    probabilistically.
+    """
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# ============================================================================
+# SIEVING
+# ============================================================================
+
+def _simple_sieve(limit):
+    """Return all odd primes <= limit as an array('q')"""
+    if limit < 3:
+        return array("q")
+    # flags[i] represents the odd number 2*i + 1
+    size = limit // 2 + 1
+    flags = bytearray([1]) * size
+    flags[0] = 0
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return array("q", compress(range(1, 2 * size, 2), flags))
+
+
+def _sieve_segment(lo, hi, base_primes):
+    """
+    Sieve the odd numbers in [lo, hi).
+
+    Returns (first_odd, flags) where flags[i] is 1 iff first_odd + 2*i is
+    prime.
+    """
+    start = lo | 1
+    size = max(0, (hi - start + 1) // 2)
+    flags = bytearray([1]) * size
+    if size == 0:
+        return start, flags
+    if start == 1:
+        flags[0] = 0
+    for p in base_primes:
+        pp = p * p
+        if pp >= hi:
+            break
+        first = max(pp, (start + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        index = (first - start) // 2
+        if index < size:
+            flags[index::p] = bytes(len(range(index, size, p)))
+    return start, flags
+
+
+def _init_worker(base_primes):
+    global _worker_base_primes
+    _worker_base_primes = base_primes
+
+
+def _segment_primes(lo, hi):
+    """Pool task: primes in [lo, hi) as a compact array('q')"""
+    start, flags = _sieve_segment(lo, hi, _worker_base_primes)
+    return array("q", compress(range(start, hi, 2), flags))
+
+
+def _segment_count(lo, hi):
+    """Pool task: number of odd primes in [lo, hi)"""
+    return _sieve_segment(lo, hi, _worker_base_primes)[1].count(1)
+
+
+def _segments(lo, hi, segment_size):
+    for seg_lo in range(lo, hi, segment_size):
+        yield seg_lo, min(seg_lo + segment_size, hi)
+
+
+def _resolve_workers(workers):
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return workers
+
+
+def _run_segments(task, lo, hi, segment_size, workers, base_primes):
+    """
+    Yield task(seg_lo, seg_hi) for every segment, in order.
+
+    With several workers, at most 2 * workers segments are in flight so a
+    slow consumer never causes unbounded buffering.
+    """
+    if workers == 1:
+        _init_worker(base_primes)
+        for seg_lo, seg_hi in _segments(lo, hi, segment_size):
+            yield task(seg_lo, seg_hi)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(base_primes,)) as pool:
+        pending = deque()
+        for seg_lo, seg_hi in _segments(lo, hi, segment_size):
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(task, seg_lo, seg_hi))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _check_range(lo, hi, segment_size):
+    if lo < 0 or hi < 0:
+        raise ValueError("bounds must be non-negative")
+    if segment_size < 2:
+        raise ValueError("segment_size must be at least 2")
+
+
+def primes_between(lo, hi, *, workers=1, segment_size=DEFAULT_SEGMENT_SIZE):
+    """
+    Stream the primes p with lo <= p < hi in ascending order.
+
+    Args:
+        lo: Inclusive lower bound
+        hi: Exclusive upper bound
+        workers: Number of processes to sieve with (None = all cores)
+        segment_size: Integers covered by each segment
+
+    Yields:
+        Each prime in the range as an int
+    """
+    _check_range(lo, hi, segment_size)
+    workers = _resolve_workers(workers)
+    if lo >= hi:
+        return
+    if lo <= 2 < hi:
+        yield 2
+    base_primes = _simple_sieve(isqrt(hi - 1))
+    for block in _run_segments(_segment_primes, lo, hi, segment_size,
+                               workers, base_primes):
+        yield from block
+
+
+def count_primes(lo, hi, *, workers=1, segment_size=DEFAULT_SEGMENT_SIZE):
+    """Count the primes p with lo <= p < hi without materializing them"""
+    _check_range(lo, hi, segment_size)
+    workers = _resolve_workers(workers)
+    if lo >= hi:
+        return 0
+    total = 1 if lo <= 2 < hi else 0
+    base_primes = _simple_sieve(isqrt(hi - 1))
+    for count in _run_segments(_segment_count, lo, hi, segment_size,
+                               workers, base_primes):
+        total += count
+    return total
+
+
+def primes_up_to(n, *, workers=1):
+    """Return all primes <= n as an array('q')"""
+    return array("q", primes_between(0, n + 1, workers=workers))
@@ -0,0 +1,61 @@
+"""
+Product Trees
+=============
+Balanced multiplication for big integers.
+
+Multiplying terms one at a time, as the factorial loop in
+python_core.control_flow and `reduce(lambda x, y: x * y, ...)` in
+python_core.functions do, makes every step multiply a huge accumulator by
+a small number, which is quadratic overall. Multiplying in a balanced tree
+keeps operands of similar size, so CPython's Karatsuba multiplication does
+the heavy lifting:
+
+    >>> product_tree([1, 2, 3, 4, 5])
+    120
+    >>> factorial(20)
+    2432902008176640000
+"""
+
+from operator import mul
+
+
+def product_tree(iterable, start=1):
+    """
+    Multiply all items by pairing neighbours level by level.
+
+    Drop-in replacement for reduce(lambda x, y: x * y, iterable, start)
+    whenever the multiplication is associative.
+    """
+    level = list(iterable)
+    if not level:
+        return start
+    while len(level) > 1:
+        paired = list(map(mul, level[::2], level[1::2]))
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    if start == 1:
+        return level[0]
+    return start * level[0]
+
+
+def _odd_product(start, stop):
+    """Product of the odd numbers in range(start, stop, 2)"""
+    return product_tree(range(start, stop, 2))
+
+
+def factorial(n):
+    """
+    n! by binary splitting.
+
+    n! = odd_part(n) * 2**(n - popcount(n)). The odd part is built from
+    products of the odd numbers in (n >> (i+1), n >> i] for each bit i, each
+    computed with a product tree, and the power of two is a single shift.
+    """
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    inner = outer = 1
+    for i in reversed(range(n.bit_length())):
+        inner *= _odd_product((n >> (i + 1)) + 1 | 1, (n >> i) + 1 | 1)
+        outer *= inner
+    return outer << (n - bin(n).count("1"))
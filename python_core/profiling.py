@@ -0,0 +1,240 @@
+"""
+Profiling Registry
+==================
+A process-wide registry of call counts and latency histograms, recorded
+with time.perf_counter_ns.
+
+The `timing_decorator` in python_core.functions and
+python_core.advanced_topics prints one line per call using time.time().
+At high call rates the printing costs more than the function being measured.
+The decorator here only records into a histogram, and prints nothing:
+
+    @timing_decorator
+    def parse(line):
+        ...
+
+    registry.export_at_exit("timings.json")
+
+While the registry is disabled, a decorated function only pays for the
+wrapper call and one attribute check. Histograms use HDR-style log-linear buckets, so
+percentiles carry a bounded relative error (about 3%) in fixed memory.
+"""
+
+import atexit
+import csv
+import json
+import threading
+import time
+from functools import wraps
+
+# Each power of two is split into 2**SUB_BITS linear sub-buckets.
+SUB_BITS = 5
+_SUB_COUNT = 1 << SUB_BITS
+_BUCKETS = (64 - SUB_BITS) * _SUB_COUNT + 2 * _SUB_COUNT
+
+
+def _bucket_index(value):
+    """Map a non-negative int to its histogram bucket"""
+    exponent = value.bit_length() - SUB_BITS - 1
+    if exponent <= 0:
+        return value
+    return exponent * _SUB_COUNT + (value >> exponent)
+
+
+def _bucket_high(index):
+    """Largest value that lands in the given bucket"""
+    if index < 2 * _SUB_COUNT:
+        return index
+    exponent, top = divmod(index, _SUB_COUNT)
+    exponent -= 1
+    top += _SUB_COUNT
+    return ((top + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of nanosecond latencies"""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop all samples, keeping this object (and bound methods) valid"""
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        # Inlined _bucket_index: this runs once per profiled call.
+        exponent = value.bit_length() - SUB_BITS - 1
+        if exponent <= 0:
+            self.counts[value] += 1
+        else:
+            self.counts[exponent * _SUB_COUNT + (value >> exponent)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def merge(self, other):
+        """Add another histogram's samples into this one"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def percentile(self, p):
+        """Value at or below which p percent of samples fall (0 if empty)"""
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_high(index), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class FunctionStats:
+    """Calls and latency histogram for one decorated function"""
+
+    __slots__ = ("name", "histogram", "lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.histogram = LatencyHistogram()
+        self.lock = threading.Lock()
+
+    def record(self, elapsed_ns):
+        with self.lock:
+            self.histogram.record(elapsed_ns)
+
+    def summary(self):
+        """Plain dict of the headline numbers, times in nanoseconds"""
+        with self.lock:
+            h = self.histogram
+            return {
+                "name": self.name,
+                "calls": h.count,
+                "total_ns": h.total,
+                "mean_ns": round(h.mean),
+                "min_ns": h.min or 0,
+                "p50_ns": h.percentile(50),
+                "p90_ns": h.percentile(90),
+                "p99_ns": h.percentile(99),
+                "max_ns": h.max,
+            }
+
+
+class Registry:
+    """Process-wide collection of FunctionStats keyed by qualified name"""
+
+    FIELDS = ("name", "calls", "total_ns", "mean_ns", "min_ns",
+              "p50_ns", "p90_ns", "p99_ns", "max_ns")
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def stats_for(self, name):
+        """Get or create the stats entry for name"""
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, FunctionStats(name))
+        return stats
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Drop all recorded samples, keeping decorated functions registered"""
+        for stats in list(self._stats.values()):
+            with stats.lock:
+                stats.histogram.clear()
+
+    def snapshot(self):
+        """List of summary dicts, busiest function first"""
+        rows = [stats.summary() for stats in list(self._stats.values())]
+        return sorted(rows, key=lambda row: row["total_ns"], reverse=True)
+
+    def report(self):
+        """Human-readable table of the snapshot, times in microseconds"""
+        lines = [f"{'function':<40} {'calls':>10} {'p50 us':>10} "
+                 f"{'p99 us':>10} {'max us':>10}"]
+        for row in self.snapshot():
+            lines.append(
+                f"{row['name']:<40} {row['calls']:>10} "
+                f"{row['p50_ns'] / 1000:>10.1f} {row['p99_ns'] / 1000:>10.1f} "
+                f"{row['max_ns'] / 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def to_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def to_csv(self, path):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.snapshot())
+
+    def export(self, path):
+        """Write the snapshot as CSV if path ends in .csv, else JSON"""
+        if str(path).endswith(".csv"):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+
+    def export_at_exit(self, path):
+        """Export to path when the interpreter exits"""
+        atexit.register(self.export, path)
+
+
+registry = Registry()
+
+
+def timing_decorator(func=None, *, name=None, registry=registry):
+    """
+    Record every call's latency into the registry.
+
+    Usable as @timing_decorator or @timing_decorator(name="custom.name").
+    """
+    if func is None:
+        return lambda f: timing_decorator(f, name=name, registry=registry)
+
+    stats = registry.stats_for(name or f"{func.__module__}.{func.__qualname__}")
+    lock = stats.lock
+    record = stats.histogram.record
+    clock = time.perf_counter_ns
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not registry.enabled:
+            return func(*args, **kwargs)
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            with lock:
+                record(elapsed)
+
+    wrapper.stats = stats
+    return wrapper
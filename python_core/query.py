@@ -0,0 +1,164 @@
+"""
+Fused Queries
+=============
+`Q` chains map and filter stages and compiles them into one generated loop.
+
+The generator pipeline in python_core.advanced_topics,
+`filter_even(square(numbers()))`, resumes one generator frame per stage for
+every element. `Q` builds the same pipeline but runs it as a single for-loop:
+
+    >>> Q(range(10)).map(lambda x: x ** 2).filter(lambda x: x % 2 == 0).to_list()
+    [0, 4, 16, 36, 64]
+
+Callable stages still cost one call per element each; on CPython 3.11 that
+is about what resuming a generator frame costs, so a Q of lambdas is no
+faster than the nested generators (see benchmarks.bench_query).
+Fusion only pays off for stages given as a string expression in `x`. The
+expression is pasted into the generated loop, so it costs no function call
+at all:
+
+    >>> Q(range(10)).map("x ** 2").filter("x % 2 == 0").sum()
+    120
+
+String expressions see only the builtins and any names passed as
+keyword arguments to Q, e.g. Q(data, limit=10).filter("x < limit").
+Each must compile on its own as a single expression, or SyntaxError is
+raised when the stage is added. They are code run by exec(): never build
+them from untrusted input.
+Compiled loops are cached by pipeline shape, so building the same Q again
+is cheap.
+"""
+
+import keyword
+import re
+
+_compiled = {}
+
+# Names the generated code uses itself, which keyword arguments must avoid.
+_RESERVED = {"x", "source", "funcs", "initial", "func", "fused",
+             "out", "append", "add", "total", "n", "acc"}
+_STAGE_NAME = re.compile(r"f\d+$")
+
+_TERMINALS = {
+    "list": ("out = []\n    append = out.append", "append(x)", "return out"),
+    "set": ("out = set()\n    add = out.add", "add(x)", "return out"),
+    "sum": ("total = 0", "total += x", "return total"),
+    "count": ("n = 0", "n += 1", "return n"),
+    "iter": ("pass", "yield x", "return"),
+    "reduce": ("acc = initial", "acc = func(acc, x)", "return acc"),
+}
+
+
+def _compile(stages, terminal, env_names):
+    """Generate and cache the fused loop for a pipeline shape"""
+    key = (stages, terminal, env_names)
+    func = _compiled.get(key)
+    if func is not None:
+        return func
+
+    params = ["source", "funcs", "initial", "func"] + list(env_names)
+    setup, emit, finish = _TERMINALS[terminal]
+    lines = [f"def fused({', '.join(params)}):"]
+    call_names = []
+    for i, (kind, expr) in enumerate(stages):
+        if expr is None:
+            call_names.append(f"f{i}")
+    if call_names:
+        lines.append(f"    {', '.join(call_names)}, = funcs")
+    lines.append(f"    {setup}")
+    lines.append("    for x in source:")
+    for i, (kind, expr) in enumerate(stages):
+        # The newline ends any trailing comment inside the parentheses.
+        value = f"f{i}(x)" if expr is None else f"({expr}\n)"
+        if kind == "map":
+            lines.append(f"        x = {value}")
+        else:
+            lines.append(f"        if not {value}:")
+            lines.append("            continue")
+    lines.append(f"        {emit}")
+    lines.append(f"    {finish}")
+    source = "\n".join(lines)
+
+    namespace = {}
+    exec(compile(source, f"<Q {terminal}>", "exec"), {}, namespace)
+    func = namespace["fused"]
+    func.source = source
+    _compiled[key] = func
+    return func
+
+
+class Q:
+    """Lazy, immutable map/filter pipeline over an iterable"""
+
+    __slots__ = ("_source", "_stages", "_funcs", "_env")
+
+    def __init__(self, source, **env):
+        for name in env:
+            if (name in _RESERVED or _STAGE_NAME.match(name)
+                    or keyword.iskeyword(name)):
+                raise ValueError(f"{name!r} is reserved inside Q expressions")
+        self._source = source
+        self._stages = ()
+        self._funcs = ()
+        self._env = env
+
+    def _with(self, kind, stage):
+        q = Q.__new__(Q)
+        q._source = self._source
+        q._env = self._env
+        if isinstance(stage, str):
+            # Reject statements and stray brackets before they reach the
+            # generated source, where they would misparse or run.
+            compile(stage, "<Q stage>", "eval")
+            q._stages = self._stages + ((kind, stage),)
+            q._funcs = self._funcs
+        elif callable(stage):
+            q._stages = self._stages + ((kind, None),)
+            q._funcs = self._funcs + (stage,)
+        else:
+            raise TypeError(f"{kind} stage must be callable or str, "
+                            f"not {type(stage).__name__}")
+        return q
+
+    def map(self, func):
+        """Add a stage replacing each x with func(x) (or an expression)"""
+        return self._with("map", func)
+
+    def filter(self, predicate):
+        """Add a stage keeping x only when predicate(x) is true"""
+        return self._with("filter", predicate)
+
+    def _run(self, terminal, initial=None, func=None):
+        names = tuple(sorted(self._env))
+        fused = _compile(self._stages, terminal, names)
+        return fused(self._source, self._funcs, initial, func,
+                     *(self._env[name] for name in names))
+
+    def source(self, terminal="list"):
+        """Python source of the generated loop, for inspection"""
+        return _compile(self._stages, terminal, tuple(sorted(self._env))).source
+
+    def __iter__(self):
+        return self._run("iter")
+
+    def to_list(self):
+        return self._run("list")
+
+    def to_set(self):
+        return self._run("set")
+
+    def sum(self):
+        return self._run("sum")
+
+    def count(self):
+        return self._run("count")
+
+    def reduce(self, func, initial):
+        """Fold the results into initial with func(acc, x)"""
+        return self._run("reduce", initial, func)
+
+    def __repr__(self):
+        stages = " -> ".join(
+            f"{kind}({expr if expr is not None else '<func>'})"
+            for kind, expr in self._stages)
+        return f"Q({type(self._source).__name__}{' -> ' if stages else ''}{stages})"
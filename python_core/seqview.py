@@ -0,0 +1,113 @@
+"""
+Sequence Views
+==============
+`SeqView` slices a list, tuple, array or memoryview in O(1) without copying.
+
+python_core.functions sums a list with `numbers[0] + recursive_sum(numbers[1:])`
+and python_core.control_flow scans `for num in numbers[1:]`. Each `[1:]`
+copies the rest of the list, so the recursion is O(n**2). Slicing a view only
+creates a new `range` of indices into the same underlying sequence:
+
+    >>> data = list(range(10))
+    >>> view = SeqView(data)[2:][::2]
+    >>> list(view), len(view), view[-1]
+    ([2, 4, 6, 8], 4, 8)
+"""
+
+from collections.abc import Sequence
+
+
+class SeqView(Sequence):
+    """Read-only, zero-copy window over an indexable sequence"""
+
+    __slots__ = ("_seq", "_indices")
+
+    def __init__(self, seq, start=None, stop=None, step=None):
+        if isinstance(seq, SeqView):
+            indices = seq._indices
+            seq = seq._seq
+        else:
+            indices = range(len(seq))
+        self._seq = seq
+        self._indices = indices[start:stop:step]
+
+    @classmethod
+    def _from_indices(cls, seq, indices):
+        view = cls.__new__(cls)
+        view._seq = seq
+        view._indices = indices
+        return view
+
+    @property
+    def base(self):
+        """The underlying sequence this view reads from"""
+        return self._seq
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_indices(self._seq, self._indices[index])
+        try:
+            return self._seq[self._indices[index]]
+        except IndexError:
+            raise IndexError("SeqView index out of range") from None
+
+    def __iter__(self):
+        # Index the base directly: islice() would walk it from index 0.
+        return map(self._seq.__getitem__, self._indices)
+
+    def __reversed__(self):
+        return map(self._seq.__getitem__, reversed(self._indices))
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        r = self._indices
+        return (f"SeqView({type(self._seq).__name__}, "
+                f"start={r.start}, stop={r.stop}, step={r.step})")
+
+    def tolist(self):
+        """Copy the viewed elements into a new list"""
+        return list(self)
+
+
+def as_view(seq):
+    """Wrap seq in a SeqView unless it already is one"""
+    return seq if isinstance(seq, SeqView) else SeqView(seq)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def recursive_sum(numbers):
+    """
+    Sum a sequence recursively, as in python_core.functions.
+
+    Each level recurses on a view of the tail instead of a copy, so the total
+    work is O(n). Depth is still bounded by sys.getrecursionlimit().
+    """
+    numbers = as_view(numbers)
+    if not numbers:
+        return 0
+    return numbers[0] + recursive_sum(numbers[1:])
+
+
+def maximum(numbers):
+    """Largest element, scanning the tail through a view rather than a copy"""
+    numbers = as_view(numbers)
+    if not numbers:
+        raise ValueError("maximum() arg is an empty sequence")
+    max_num = numbers[0]
+    for num in numbers[1:]:
+        if num > max_num:
+            max_num = num
+    return max_num
@@ -0,0 +1,244 @@
+"""
+Shared-Memory Cache
+===================
+A fixed-capacity hash table in `multiprocessing.shared_memory` that every
+worker of a process pool reads and writes. A result computed by one worker
+is then a hit for all of them, unlike a per-process `lru_cache`:
+
+    cache = SharedCache(capacity=1 << 16)
+
+    @shared_cached(cache)
+    def fibonacci_cached(n):
+        ...
+
+    with ProcessPoolExecutor(mp_context=get_context("fork")) as pool:
+        pool.map(fibonacci_cached, work)      # workers inherit cache
+    cache.close(); cache.unlink()
+
+Layout: the table is split into buckets of WAYS fixed-size slots. A key
+hashes to one bucket and can live in any of that bucket's slots. A full
+bucket overwrites its slots round-robin, which makes the table a cache
+rather than a map. Each slot holds the key and value bytes, up to
+`slot_size` bytes in total. Values are pickled by default. Pass a struct
+format such as value_format="q" for fixed-width values, which are cheaper
+to encode and decode.
+
+Writes take one of `stripes` locks, chosen by bucket, so writers to
+different buckets do not contend. Reads take no lock. Every slot carries a
+sequence number that is odd while a write is in progress (a seqlock), and a
+reader that sees it change retries.
+
+To use the cache in spawned (not forked) workers, pass the SharedCache
+object as a Process argument or pool initializer argument. It re-attaches
+to the same segment on unpickling.
+"""
+
+import hashlib
+import multiprocessing
+import pickle
+import struct
+from functools import wraps
+from multiprocessing import resource_tracker, shared_memory
+
+from python_core.cache import make_key
+
+WAYS = 8
+# seq, key length, value length, key hash
+_SLOT_HEADER = struct.Struct("<IHHQ")
+_SEQ = struct.Struct("<I")
+# Readers compare seq only for parity and equality, so it wraps safely.
+_SEQ_MASK = 0xFFFFFFFF
+_META = struct.Struct("<HHQ")  # the header after seq
+# Lock-free read attempts before falling back to the stripe lock.
+_READ_RETRIES = 4
+
+
+def _key_bytes(key):
+    data = pickle.dumps(key, 4)
+    return data, int.from_bytes(
+        hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class SharedCache:
+    """
+    Fixed-capacity key/value cache in shared memory.
+
+    Args:
+        capacity: Number of slots (rounded up to a multiple of WAYS)
+        slot_size: Bytes per slot for the pickled key plus the value
+        stripes: Number of write locks
+        value_format: struct format for fixed-width values, or None to pickle
+        name: Shared memory segment name (default: generated)
+    """
+
+    def __init__(self, capacity=1 << 16, slot_size=64, stripes=64,
+                 value_format=None, name=None, context=None):
+        self.buckets = max(1, -(-capacity // WAYS))
+        self.slot_size = slot_size
+        self.value_format = value_format
+        self._stride = _SLOT_HEADER.size + slot_size
+        size = self.buckets * (1 + WAYS * self._stride)
+        self._shm = shared_memory.SharedMemory(name=name, create=True,
+                                               size=size)
+        self._shm.buf[:size] = bytes(size)
+        ctx = context or multiprocessing.get_context()
+        self._locks = [ctx.Lock() for _ in range(min(stripes, self.buckets))]
+        self._setup()
+
+    def _setup(self):
+        self._buf = self._shm.buf
+        self._value = (struct.Struct(self.value_format)
+                       if self.value_format else None)
+        self.hits = self.misses = self.retries = 0
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def capacity(self):
+        return self.buckets * WAYS
+
+    def __getstate__(self):
+        return {"name": self._shm.name, "buckets": self.buckets,
+                "slot_size": self.slot_size, "stride": self._stride,
+                "value_format": self.value_format, "locks": self._locks}
+
+    def __setstate__(self, state):
+        self.buckets = state["buckets"]
+        self.slot_size = state["slot_size"]
+        self._stride = state["stride"]
+        self.value_format = state["value_format"]
+        self._locks = state["locks"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        # Attaching registers the segment with this process's resource
+        # tracker, which would unlink it when the worker exits.
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._setup()
+
+    def _bucket(self, h):
+        index = h % self.buckets
+        return index, index * (1 + WAYS * self._stride)
+
+    def _encode(self, value):
+        if self._value is not None:
+            return self._value.pack(value)
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, data):
+        if self._value is not None:
+            return self._value.unpack(data)[0]
+        return pickle.loads(data)
+
+    def _read(self, base, kb, h):
+        """Raw value bytes for kb in the bucket at base, or None.
+        Raises BlockingIOError if a concurrent write was seen."""
+        buf = self._buf
+        unpack = _SLOT_HEADER.unpack_from
+        for way in range(WAYS):
+            slot = base + 1 + way * self._stride
+            seq, klen, vlen, khash = unpack(buf, slot)
+            if khash != h or klen != len(kb):
+                continue
+            start = slot + _SLOT_HEADER.size
+            stored = bytes(buf[start:start + klen])
+            value = bytes(buf[start + klen:start + klen + vlen])
+            if seq & 1 or _SEQ.unpack_from(buf, slot)[0] != seq:
+                raise BlockingIOError
+            if stored == kb:
+                return value
+        return None
+
+    def get(self, key, default=None):
+        kb, h = _key_bytes(key)
+        index, base = self._bucket(h)
+        for _ in range(_READ_RETRIES):
+            try:
+                data = self._read(base, kb, h)
+                break
+            except BlockingIOError:
+                self.retries += 1
+        else:
+            with self._locks[index % len(self._locks)]:
+                data = self._read(base, kb, h)
+        if data is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self._decode(data)
+
+    def put(self, key, value):
+        """Store value; returns False if key and value do not fit a slot"""
+        kb, h = _key_bytes(key)
+        vb = self._encode(value)
+        if len(kb) + len(vb) > self.slot_size:
+            return False
+        index, base = self._bucket(h)
+        buf = self._buf
+        with self._locks[index % len(self._locks)]:
+            target = None
+            for way in range(WAYS):
+                slot = base + 1 + way * self._stride
+                _, klen, _, khash = _SLOT_HEADER.unpack_from(buf, slot)
+                if klen == 0 or (khash == h and bytes(
+                        buf[slot + _SLOT_HEADER.size:
+                            slot + _SLOT_HEADER.size + klen]) == kb):
+                    target = slot
+                    break
+            if target is None:
+                way = buf[base]
+                buf[base] = (way + 1) % WAYS
+                target = base + 1 + way * self._stride
+            seq = _SEQ.unpack_from(buf, target)[0]
+            _SEQ.pack_into(buf, target, (seq + 1) & _SEQ_MASK)
+            start = target + _SLOT_HEADER.size
+            buf[start:start + len(kb)] = kb
+            buf[start + len(kb):start + len(kb) + len(vb)] = vb
+            _META.pack_into(buf, target + _SEQ.size, len(kb), len(vb), h)
+            # Publish last, in a store of its own: a reader that sees the
+            # even seq must also see the lengths and hash written above.
+            _SEQ.pack_into(buf, target, (seq + 2) & _SEQ_MASK)
+        return True
+
+    def clear(self):
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            self._buf[:] = bytes(len(self._buf))
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        self.unlink()
+
+
+def shared_cached(cache, key=make_key):
+    """Decorator memoizing a function in a SharedCache"""
+    missing = object()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            value = cache.get(k, missing)
+            if value is missing:
+                value = func(*args, **kwargs)
+                cache.put(k, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,227 @@
+"""
+Span Profiler
+=============
+A nestable `Timer` context manager that builds a call tree of named spans.
+
+The `Timer` in python_core.advanced_topics prints one flat elapsed time.
+This one records each span under its parent with time.perf_counter_ns.
+Repeated spans with the same path are aggregated, so a long batch job
+can see where its time goes without an external profiler:
+
+    with Timer("batch"):
+        for chunk in chunks:
+            with Timer("parse"):
+                ...
+            with Timer("write"):
+                ...
+
+    print(profiler.report())
+    profiler.to_speedscope("batch.speedscope.json")   # https://speedscope.app
+    profiler.to_collapsed("batch.folded")             # flamegraph.pl input
+
+Each thread keeps its own span stack. All threads record into the same
+tree, so identical paths from different threads are added together.
+Closing spans out of order raises RuntimeError, unless an exception is
+already propagating; then it is only counted in profiler.mismatches.
+"""
+
+import json
+import threading
+from time import perf_counter_ns
+
+
+class SpanNode:
+    """Aggregated timings for every span that ran at one call-tree path"""
+
+    __slots__ = ("name", "count", "total_ns", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.children = {}
+
+    @property
+    def self_ns(self):
+        """Time spent in this span outside any child span"""
+        return self.total_ns - sum(c.total_ns for c in self.children.values())
+
+    def walk(self, path=()):
+        """Yield (path, node) for this node's descendants, depth first"""
+        for child in self.children.values():
+            child_path = path + (child.name,)
+            yield child_path, child
+            yield from child.walk(child_path)
+
+
+class SpanProfiler:
+    """Collects spans from Timer blocks into an aggregated call tree"""
+
+    def __init__(self):
+        self.root = SpanNode("<root>")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Out-of-order closes seen while an exception was propagating,
+        # when raising would have replaced that exception.
+        self.mismatches = 0
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = [self.root]
+        elif stack[0] is not self.root:
+            # reset() ran while spans were open in this thread: move them
+            # into the new tree so they and their children land there.
+            rebased = [self.root]
+            with self._lock:
+                for node in stack[1:]:
+                    rebased.append(rebased[-1].children.setdefault(
+                        node.name, SpanNode(node.name)))
+            stack[:] = rebased
+        return stack
+
+    def _enter(self, name):
+        """Open a span; returns its depth in this thread's stack"""
+        stack = self._stack()
+        parent = stack[-1]
+        node = parent.children.get(name)
+        if node is None:
+            with self._lock:
+                node = parent.children.setdefault(name, SpanNode(name))
+        stack.append(node)
+        return len(stack) - 1
+
+    def _exit(self, depth, elapsed_ns, strict=True):
+        """Close the span at depth; a mismatch raises only when strict"""
+        stack = self._stack()
+        if depth >= len(stack):
+            if not strict:
+                self.mismatches += 1
+                return
+            raise RuntimeError("span closed after its parent span")
+        node = stack[depth]
+        abandoned = len(stack) - 1 - depth
+        # Unwind first, so the stack stays usable even when we raise.
+        del stack[depth:]
+        with self._lock:
+            node.count += 1
+            node.total_ns += elapsed_ns
+        if abandoned and not strict:
+            self.mismatches += 1
+        elif abandoned:
+            raise RuntimeError(f"span {node.name!r} closed out of order, "
+                               f"{abandoned} inner span(s) still open")
+
+    def span(self, name):
+        """Timer bound to this profiler"""
+        return Timer(name, profiler=self)
+
+    def reset(self):
+        """Forget all recorded spans; open spans are recorded in the new
+        tree when they close"""
+        with self._lock:
+            self.root = SpanNode("<root>")
+            self.mismatches = 0
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def collapsed(self):
+        """Lines of "a;b;c <self microseconds>" in collapsed-stack format"""
+        lines = []
+        for path, node in self.root.walk():
+            self_us = node.self_ns // 1000
+            if self_us > 0:
+                lines.append(f"{';'.join(path)} {self_us}")
+        return lines
+
+    def to_collapsed(self, path):
+        with open(path, "w") as f:
+            f.write("\n".join(self.collapsed()) + "\n")
+
+    def speedscope(self, name="python_core spans"):
+        """Dict in speedscope's file format, one weighted sample per path"""
+        frames = []
+        frame_index = {}
+        samples = []
+        weights = []
+        for path, node in self.root.walk():
+            stack = []
+            for frame in path:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame})
+                stack.append(frame_index[frame])
+            if node.self_ns > 0:
+                samples.append(stack)
+                weights.append(node.self_ns)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "nanoseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": name,
+            "exporter": "python_core.spans",
+        }
+
+    def to_speedscope(self, path, name="python_core spans"):
+        with open(path, "w") as f:
+            json.dump(self.speedscope(name), f)
+
+    def report(self):
+        """Indented tree of calls, total and self time in milliseconds"""
+        lines = [f"{'span':<40} {'calls':>8} {'total ms':>10} {'self ms':>10}"]
+        for path, node in self.root.walk():
+            label = "  " * (len(path) - 1) + node.name
+            lines.append(f"{label:<40} {node.count:>8} "
+                         f"{node.total_ns / 1e6:>10.3f} {node.self_ns / 1e6:>10.3f}")
+        return "\n".join(lines)
+
+
+profiler = SpanProfiler()
+
+
+class Timer:
+    """Context manager for timing a named, nestable span"""
+
+    __slots__ = ("name", "profiler", "start_ns", "elapsed_ns", "_local")
+
+    def __init__(self, name="timer", profiler=profiler):
+        self.name = name
+        self.profiler = profiler
+        self.start_ns = None
+        self.elapsed_ns = None
+        self._local = threading.local()
+
+    def _open(self):
+        """This thread's (depth, start_ns) per entry, so reuse nests"""
+        stack = getattr(self._local, "open", None)
+        if stack is None:
+            stack = self._local.open = []
+        return stack
+
+    @property
+    def elapsed(self):
+        """Elapsed seconds of the last completed block"""
+        return self.elapsed_ns / 1e9 if self.elapsed_ns is not None else None
+
+    def __enter__(self):
+        depth = self.profiler._enter(self.name)
+        self.start_ns = perf_counter_ns()
+        self._open().append((depth, self.start_ns))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        depth, start_ns = self._open().pop()
+        self.elapsed_ns = perf_counter_ns() - start_ns
+        # Never replace an exception that is already propagating.
+        self.profiler._exit(depth, self.elapsed_ns, strict=exc_type is None)
+        return False
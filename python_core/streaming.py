@@ -0,0 +1,233 @@
+"""
+Streaming Statistics
+====================
+Constant-memory aggregators that follow the `accumulator()` send() pattern
+from python_core.advanced_topics:
+
+    acc = stats_accumulator()
+    next(acc)                       # Prime the generator
+    for latency in latencies:
+        summary = acc.send(latency)
+    print(summary.mean, summary.stdev, summary.max)
+
+    q = quantile_accumulator()
+    next(q)
+    for latency in latencies:
+        sketch = q.send(latency)
+    print(sketch.quantile(0.99))
+
+The objects behind the coroutines can also be used directly:
+
+- `Moments` keeps count, mean and variance (Welford's algorithm) plus
+  min/max.
+- `KLLSketch` is a KLL quantile sketch. With the default k=200 it answers
+  any quantile to within about 1% rank error using a few kilobytes, however
+  many values it has seen.
+
+Both merge. Give each worker process its own instance, send the instances
+back (they pickle), and merge() them. Counts, min and max merge exactly.
+The merged mean and variance match a single-pass computation up to
+floating-point rounding. A merged sketch carries the same error bound as
+one that saw every value itself.
+"""
+
+import math
+import random
+
+
+class Moments:
+    """Count, mean, variance, min and max of a stream in O(1) memory"""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0          # sum of squared deviations from the mean
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Welford's update for one value"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+
+    def merge(self, other):
+        """Fold another Moments in (Chan et al. parallel combination)"""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Population variance"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def summary(self):
+        return {"count": self.count, "mean": self.mean,
+                "stdev": self.stdev, "min": self.min, "max": self.max}
+
+    def __repr__(self):
+        return (f"Moments(count={self.count}, mean={self.mean:.6g}, "
+                f"stdev={self.stdev:.6g}, min={self.min}, max={self.max})")
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in a stack of compactors. An item at level h stands for
+    2**h original values. When a level fills up it is sorted, and every
+    other item (at a random offset) moves up a level while the rest are
+    dropped. Lower levels get geometrically smaller capacities, so total
+    memory is O(k) and rank error is about 1.7/k.
+    """
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.levels = [[]]
+        self._size = 0
+        self._random = random.Random(seed)
+        self._capacity = self._level_capacities()
+
+    def _level_capacities(self):
+        height = len(self.levels)
+        caps = [max(2, int(math.ceil(self.k * (2 / 3) ** (height - h - 1))))
+                for h in range(height)]
+        self._max_size = sum(caps)
+        return caps
+
+    def _grow(self):
+        self.levels.append([])
+        self._capacity = self._level_capacities()
+
+    def _compress(self):
+        """Compact the lowest full level until the sketch fits again"""
+        while self._size >= self._max_size:
+            for h, items in enumerate(self.levels):
+                if len(items) >= self._capacity[h]:
+                    if h + 1 == len(self.levels):
+                        self._grow()
+                    items.sort()
+                    keep = [items.pop()] if len(items) % 2 else []
+                    offset = self._random.getrandbits(1)
+                    self.levels[h + 1].extend(items[offset::2])
+                    self._size -= len(items) - len(items) // 2
+                    self.levels[h] = keep
+                    break
+
+    def add(self, value):
+        self.levels[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update(self, values):
+        values = list(values)
+        self.levels[0].extend(values)
+        self.count += len(values)
+        self._size += len(values)
+        self._compress()
+
+    def merge(self, other):
+        """Fold another sketch in; the result keeps the same error bound"""
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.count += other.count
+        self._size = sum(map(len, self.levels))
+        self._compress()
+        return self
+
+    def _weighted(self):
+        pairs = [(item, 1 << h)
+                 for h, items in enumerate(self.levels) for item in items]
+        pairs.sort(key=lambda pair: pair[0])
+        return pairs
+
+    def quantile(self, q):
+        """Approximate value at quantile q (0 <= q <= 1)"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        pairs = self._weighted()
+        if not pairs:
+            raise ValueError("quantile of an empty sketch")
+        total = sum(weight for _, weight in pairs)
+        target = q * total
+        seen = 0
+        for item, weight in pairs:
+            seen += weight
+            if seen >= target:
+                return item
+        return pairs[-1][0]
+
+    def quantiles(self, qs):
+        return [self.quantile(q) for q in qs]
+
+    def rank(self, value):
+        """Approximate number of values <= value"""
+        return sum(weight for item, weight in self._weighted() if item <= value)
+
+    def __len__(self):
+        """Number of items retained (not the number of values seen)"""
+        return self._size
+
+    def __repr__(self):
+        return (f"KLLSketch(k={self.k}, count={self.count}, "
+                f"retained={self._size}, levels={len(self.levels)})")
+
+
+# ============================================================================
+# send() COROUTINES
+# ============================================================================
+
+def stats_accumulator():
+    """Generator that accumulates count, mean, variance, min and max"""
+    moments = Moments()
+    while True:
+        value = yield moments
+        if value is not None:
+            moments.add(value)
+
+
+def quantile_accumulator(k=200, seed=None):
+    """Generator that feeds values into a KLL quantile sketch"""
+    sketch = KLLSketch(k, seed)
+    while True:
+        value = yield sketch
+        if value is not None:
+            sketch.add(value)
@@ -0,0 +1,186 @@
+"""
+Trampolined Recursion
+=====================
+Run recursive definitions on an explicit heap-allocated stack, so recursion
+depth is limited only by memory instead of sys.getrecursionlimit().
+
+A trampolined function is written as a generator. Where the plain version
+would call itself, it yields `func.call(...)` and receives the result:
+
+    @trampoline
+    def factorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield factorial.call(n - 1))
+
+Returning `func.call(...)` instead of yielding it is a tail call: the current
+frame is discarded before the callee runs, so tail-recursive loops use
+constant memory. Exceptions raised by a callee are thrown into the caller at
+its `yield`, so try/except works as it does with ordinary recursion.
+
+`factorial`, `fibonacci` and `recursive_sum` below are the recursive
+functions from python_core.functions rewritten this way.
+"""
+
+from functools import update_wrapper
+from types import GeneratorType
+
+from python_core.seqview import as_view
+
+_MISSING = object()
+
+
+class _Call(tuple):
+    """A deferred call to a trampolined function: (target, args, kwargs)"""
+
+    # A tuple subclass so that creating one stays in C on the hot path.
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"<call {self[0].__name__}{self[1]!r}>"
+
+
+def _default_key(args, kwargs):
+    if kwargs:
+        return args, frozenset(kwargs.items())
+    return args
+
+
+class Trampolined:
+    """Callable wrapper produced by @trampoline"""
+
+    def __init__(self, func, memoize=False, key=None):
+        update_wrapper(self, func)
+        self.cache = {} if memoize else None
+        self._key = key or _default_key
+
+    def call(self, *args, **kwargs):
+        """Describe a recursive call; yield or return it from a body"""
+        return _Call((self, args, kwargs))
+
+    def __call__(self, *args, **kwargs):
+        return _run(_Call((self, args, kwargs)))
+
+    def cache_clear(self):
+        """Forget all memoized results"""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def __repr__(self):
+        return f"<trampolined {self.__qualname__}>"
+
+
+def trampoline(func=None, *, memoize=False, key=None):
+    """
+    Decorator that runs a generator-style recursive function iteratively.
+
+    Args:
+        func: The function to wrap (when used without arguments)
+        memoize: Cache results by argument, like functools.cache
+        key: Function (args, kwargs) -> hashable key for the cache, for
+            arguments that are not hashable themselves
+
+    Can be used as @trampoline or @trampoline(memoize=True).
+    """
+    if func is None:
+        return lambda f: Trampolined(f, memoize=memoize, key=key)
+    return Trampolined(func, memoize=memoize, key=key)
+
+
+def _run(call):
+    """Drive a call and every call it spawns to completion"""
+    stack = []      # (suspended generator body, its cache slots), innermost last
+    push = stack.append
+    slots = []      # (cache, key) pairs waiting for the value being computed
+    value = None
+    error = None
+    while True:
+        if call is not None:
+            target, args, kwargs = call
+            call = None
+            try:
+                cache = target.cache
+                if cache is None:
+                    result = target.__wrapped__(*args, **kwargs)
+                else:
+                    key = target._key(args, kwargs)
+                    result = cache.get(key, _MISSING)
+                    if result is _MISSING:
+                        slots.append((cache, key))
+                        result = target.__wrapped__(*args, **kwargs)
+            except Exception as exc:
+                error, slots = exc, []
+            else:
+                kind = type(result)
+                if kind is _Call:
+                    call = result
+                    continue
+                if kind is GeneratorType:
+                    push((result, slots))
+                    slots = []
+                    value = None
+                else:
+                    value = result
+                    for cache, key in slots:
+                        cache[key] = value
+                    slots = []
+
+        if not stack:
+            if error is not None:
+                raise error
+            return value
+
+        body, body_slots = stack[-1]
+        try:
+            if error is None:
+                call = body.send(value)
+            else:
+                exc, error = error, None
+                call = body.throw(exc)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            if type(result) is _Call:
+                slots = body_slots
+                call = result
+            else:
+                value = result
+                for cache, key in body_slots:
+                    cache[key] = value
+        except Exception as exc:
+            stack.pop()
+            error = exc
+        else:
+            if type(call) is not _Call:
+                error = TypeError(
+                    f"trampolined body must yield func.call(...), got {call!r}")
+                call = None
+
+
+# ============================================================================
+# RECURSIVE EXAMPLES WITHOUT A DEPTH LIMIT
+# ============================================================================
+
+@trampoline
+def factorial(n):
+    """Calculate factorial recursively"""
+    if n <= 1:
+        return 1
+    return n * (yield factorial.call(n - 1))
+
+
+@trampoline(memoize=True)
+def fibonacci(n):
+    """Calculate nth Fibonacci number"""
+    if n <= 1:
+        return n
+    return (yield fibonacci.call(n - 1)) + (yield fibonacci.call(n - 2))
+
+
+@trampoline
+def recursive_sum(numbers):
+    """Sum a sequence recursively, slicing through a zero-copy view"""
+    numbers = as_view(numbers)
+    if not numbers:
+        return 0
+    return numbers[0] + (yield recursive_sum.call(numbers[1:]))